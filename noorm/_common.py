@@ -1,6 +1,10 @@
+from typing import Any, Callable
 from enum import Enum
-from functools import lru_cache
+from dataclasses import is_dataclass, fields
+from functools import lru_cache, partial
+from operator import itemgetter
 import inspect
+import keyword
 
 from .registry import get_registry
 
@@ -22,12 +26,35 @@ class ParamsAutoEnum(Enum):
 PARAMS_APPLY_POSITIONAL = ParamsAutoEnum.PARAMS_APPLY_POSITIONAL
 PARAMS_APPLY_NAMED = ParamsAutoEnum.PARAMS_APPLY_NAMED
 
+_first_column = itemgetter(0)
+
 
 class WrapperBase:
+    __slots__ = ("_func", "_row_builder_cache")
+
     def __init__(self, func) -> None:
         self._func = func
+        self._row_builder_cache: tuple[tuple[str, ...], Callable] | None = None
         get_registry().register(func)
 
+    def _row_builder(
+        self,
+        row_type: type,
+        col_names: tuple[str, ...],
+        make: Callable[[type, tuple[str, ...]], Callable] | None = None,
+    ) -> Callable:
+        """
+        `make_row_builder` (or `make`, if given) for this wrapper's row type. The
+        builder for the last seen columns is kept on the wrapper, which spares
+        the shared cache lookup.
+        """
+        cached = self._row_builder_cache
+        if cached is not None and cached[0] == col_names:
+            return cached[1]
+        build = (make or make_row_builder)(row_type, col_names)
+        self._row_builder_cache = (col_names, build)
+        return build
+
     def unwrapped(self, *args, **kwargs):
         return self._func(*args, **kwargs)
 
@@ -45,6 +72,8 @@ def _func_args_info(func):
 
 def args_as_tuple(func, args: tuple, kwargs: dict) -> tuple:
     name_by_idx, defaults_by_idx = _func_args_info(func)
+    if not kwargs and len(args) == len(name_by_idx):
+        return args
     return args + tuple(
         kwargs[n] if (n := name_by_idx[i]) in kwargs else defaults_by_idx[i]
         for i in range(len(args), len(name_by_idx))
@@ -53,8 +82,137 @@ def args_as_tuple(func, args: tuple, kwargs: dict) -> tuple:
 
 def args_as_dict(func, args: tuple, kwargs: dict) -> dict:
     name_by_idx, defaults_by_idx = _func_args_info(func)
+    if not args and len(kwargs) == len(name_by_idx):
+        return dict(kwargs)  # a copy: the result is passed on to the driver
     return kwargs | {
         n: args[i] if i < len(args) else defaults_by_idx[i]
         for i, n in name_by_idx.items()
         if n not in kwargs
     }
+
+
+def _is_plain_namedtuple(row_type: type) -> bool:
+    # A namedtuple whose generated __new__ is not overridden in a subclass
+    for klass in getattr(row_type, "__mro__", ()):
+        if "_make" in vars(klass):
+            return row_type.__new__ is vars(klass).get("__new__")
+    return False
+
+
+def _has_generated_init(row_type: type) -> bool:
+    """
+    Whether `row_type.__init__` is the one generated by `@dataclass`: defined on a
+    dataclass itself, made by `exec` inside the dataclasses' `__create_fn__`, and
+    taking exactly the dataclass fields.
+    """
+    owner = next((k for k in row_type.__mro__ if "__init__" in vars(k)), object)
+    params = vars(owner).get("__dataclass_params__")
+    code = getattr(vars(owner)["__init__"], "__code__", None)
+    if params is None or not params.init or code is None:
+        return False
+    if code.co_filename != "<string>" or not getattr(
+        code, "co_qualname", "__create_fn__."  # no co_qualname before Python 3.11
+    ).startswith("__create_fn__."):
+        return False
+    arg_names = code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount]
+    return arg_names == tuple(fld.name for fld in fields(owner) if fld.init)
+
+
+def _settable_dataclass_fields(row_type: type) -> tuple[str, ...] | None:
+    """
+    Fields of a dataclass that can be filled by plain attribute assignment instead
+    of calling its generated `__init__`. None if this shortcut is not applicable.
+    """
+    params = getattr(row_type, "__dataclass_params__", None)
+    if params is None or params.frozen or row_type.__new__ is not object.__new__:
+        return None
+    if not _has_generated_init(row_type):
+        return None  # custom __init__
+    flds = fields(row_type)
+    if not all(fld.init for fld in flds):
+        return None
+    names = tuple(fld.name for fld in flds)
+    if tuple(inspect.signature(row_type).parameters) != names:
+        return None  # InitVar pseudo-fields
+    return names
+
+
+def _is_safe_kwarg(name) -> bool:
+    return (
+        isinstance(name, str)
+        and name.isidentifier()
+        and name.isascii()
+        and not keyword.iskeyword(name)
+    )
+
+
+@lru_cache(maxsize=2048)
+def make_row_builder(
+    row_type: type,
+    col_names: tuple[str, ...],
+    decoders: tuple[Callable[[Any], Any] | None, ...] | None = None,
+) -> Callable[[Any], Any]:
+    """
+    Makes a function that converts a positional DB row with `col_names` columns into
+    a `row_type` object. The result is the same as
+    `row_type(**{n: decode(v) for n, v in zip(col_names, row)})`, but no
+    intermediate dict is built.
+
+    `decoders` is an optional per-column tuple of value converters (None for
+    the columns that are taken as is).
+
+    `dict` and `tuple` row types are built directly from the row values.
+    """
+    namespace: dict[str, Any] = {"_t": row_type}
+    values: list[str] = []
+    for idx in range(len(col_names)):
+        decoder = decoders[idx] if decoders else None
+        if decoder is None:
+            values.append(f"r[{idx}]")
+        else:
+            namespace[f"_d{idx}"] = decoder
+            values.append(f"_d{idx}(r[{idx}])")
+    unique_names = len(set(col_names)) == len(col_names)
+
+    if row_type is tuple:
+        if not (decoders and any(decoders)):
+            return tuple
+        body = f"return ({', '.join(values)},)"
+    elif row_type is dict:
+        items = ", ".join(f"{name!r}: {val}" for name, val in zip(col_names, values))
+        body = f"return {{{items}}}"
+    elif (
+        _is_plain_namedtuple(row_type)
+        and unique_names
+        and set(col_names) == set(row_type._fields)  # type: ignore
+    ):
+        nt_fields: tuple[str, ...] = row_type._fields  # type: ignore
+        if col_names == nt_fields and not (decoders and any(decoders)):
+            return partial(tuple.__new__, row_type)
+        namespace["_new"] = tuple.__new__
+        ordered = ", ".join(values[col_names.index(name)] for name in nt_fields)
+        body = f"return _new(_t, ({ordered},))"
+    elif (
+        is_dataclass(row_type)
+        and unique_names
+        and (dc_fields := _settable_dataclass_fields(row_type)) is not None
+        and set(dc_fields) == set(col_names)
+    ):
+        namespace["_new"] = object.__new__
+        lines = ["o = _new(_t)"]
+        lines.extend(
+            f"o.{name} = {values[col_names.index(name)]}" for name in dc_fields
+        )
+        if hasattr(row_type, "__post_init__"):
+            lines.append("o.__post_init__()")
+        lines.append("return o")
+        body = "\n    ".join(lines)
+    elif unique_names and all(_is_safe_kwarg(name) for name in col_names):
+        args = ", ".join(f"{name}={val}" for name, val in zip(col_names, values))
+        body = f"return _t({args})"
+    else:
+        items = ", ".join(f"{name!r}: {val}" for name, val in zip(col_names, values))
+        body = f"return _t(**{{{items}}})"
+
+    exec(f"def build(r):\n    {body}\n", namespace)
+    return namespace["build"]
@@ -48,34 +48,64 @@ def req_sql_n_params(
         return None
 
     params: dict | tuple | None
-    if sql_n_params is not None:
-        if sql_n_params == PARAMS_APPLY_POSITIONAL:
-            sql = default_sql
-            params = args_as_tuple(func, f_args, f_kwargs)
-        elif sql_n_params == PARAMS_APPLY_NAMED:
-            sql = default_sql
-            params = args_as_dict(func, f_args, f_kwargs)
-        elif isinstance(sql_n_params, PrepareFuncResult):
-            sql = sql_n_params.sql
-            params = sql_n_params.params
-            if sql is None:
-                sql = default_sql
-            if params is None:
-                params = tuple()
-        else:
-            raise TypeError(
-                f"Function {func.__name__} returned {type(sql_n_params).__name__} "
-                "(expected None or result of 'params', 'query_and_params', or "
-                "'query_only' functions)"
-            )
-    else:
+    # Identity checks first: the sentinels and None are the most common results
+    if sql_n_params is None:
         sql = default_sql
         params = tuple()
-    if sql is None:
-        raise RuntimeError(
-            f"Function {func.__name__} did not return an SQL statement "
-            "in its result. When SQL statement is not provided in decorator params, "
-            "it should be returned by the function through the 'query_only' or "
-            "'query_and_params' function."
+    elif sql_n_params is PARAMS_APPLY_POSITIONAL:
+        sql = default_sql
+        params = args_as_tuple(func, f_args, f_kwargs)
+    elif sql_n_params is PARAMS_APPLY_NAMED:
+        sql = default_sql
+        params = args_as_dict(func, f_args, f_kwargs)
+    elif isinstance(sql_n_params, PrepareFuncResult):
+        sql = sql_n_params.sql
+        params = sql_n_params.params
+        if sql is None:
+            sql = default_sql
+        if params is None:
+            params = tuple()
+    else:
+        raise TypeError(
+            f"Function {func.__name__} returned {type(sql_n_params).__name__} "
+            "(expected None or result of 'params', 'query_and_params', or "
+            "'query_only' functions)"
         )
+    if sql is None:
+        raise _no_sql_error(func)
     return sql, params
+
+
+def req_sql_n_params_many(
+    func, f_args, f_kwargs, default_sql: str | None
+) -> list[tuple[str, dict | tuple]]:
+    """
+    Statements and parameters for the functions that return a collection of
+    'params', 'query_and_params', or 'query_only' results.
+    """
+    res: list[tuple[str, dict | tuple]] = []
+    try:
+        # A generator may also cancel the execution in the middle of the list
+        for sql_n_params in func(*f_args, **f_kwargs):
+            if not isinstance(sql_n_params, PrepareFuncResult):
+                raise TypeError(
+                    f"Function {func.__name__} returned a collection with "
+                    f"{type(sql_n_params).__name__} (expected results of 'params', "
+                    "'query_and_params', or 'query_only' functions)"
+                )
+            sql = default_sql if sql_n_params.sql is None else sql_n_params.sql
+            if sql is None:
+                raise _no_sql_error(func)
+            res.append((sql, tuple() if (p := sql_n_params.params) is None else p))
+    except CancelExecException:
+        return []
+    return res
+
+
+def _no_sql_error(func) -> RuntimeError:
+    return RuntimeError(
+        f"Function {func.__name__} did not return an SQL statement "
+        "in its result. When SQL statement is not provided in decorator params, "
+        "it should be returned by the function through the 'query_only' or "
+        "'query_and_params' function."
+    )
@@ -31,31 +31,31 @@ def req_sql_n_params(
         return None
 
     params: tuple | None
-    if sql_n_params is not None:
-        if sql_n_params == PARAMS_APPLY_POSITIONAL:
-            sql = default_sql
-            params = args_as_tuple(func, f_args, f_kwargs)
-        elif isinstance(sql_n_params, PrepareFuncResult):
-            sql = sql_n_params.sql
-            params = sql_n_params.params
-            if sql is None:
-                sql = default_sql
-            if params is None:
-                params = tuple()
-        elif sql_n_params == PARAMS_APPLY_NAMED:
-            raise ValueError(
-                f"Function {func.__name__} returned PARAMS_APPLY_NAMED that is "
-                "not supported by the DB driver"
-            )
-        else:
-            raise TypeError(
-                f"Function {func.__name__} returned {type(sql_n_params).__name__} "
-                "(expected None or result of 'params', 'query_and_params', or "
-                "'query_only' functions)"
-            )
-    else:
+    # Identity checks first: the sentinels and None are the most common results
+    if sql_n_params is None:
         sql = default_sql
         params = tuple()
+    elif sql_n_params is PARAMS_APPLY_POSITIONAL:
+        sql = default_sql
+        params = args_as_tuple(func, f_args, f_kwargs)
+    elif isinstance(sql_n_params, PrepareFuncResult):
+        sql = sql_n_params.sql
+        params = sql_n_params.params
+        if sql is None:
+            sql = default_sql
+        if params is None:
+            params = tuple()
+    elif sql_n_params is PARAMS_APPLY_NAMED:
+        raise ValueError(
+            f"Function {func.__name__} returned PARAMS_APPLY_NAMED that is "
+            "not supported by the DB driver"
+        )
+    else:
+        raise TypeError(
+            f"Function {func.__name__} returned {type(sql_n_params).__name__} "
+            "(expected None or result of 'params', 'query_and_params', or "
+            "'query_only' functions)"
+        )
     if sql is None:
         raise RuntimeError(
             f"Function {func.__name__} did not return an SQL statement "
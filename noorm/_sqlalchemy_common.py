@@ -1,4 +1,9 @@
-from sqlalchemy.sql import Executable, Select
+from typing import Callable
+from functools import lru_cache, partial
+import inspect
+
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql.selectable import GenerativeSelect
 
 from ._common import CancelExecException
 
@@ -10,10 +15,137 @@ def req_sql_n_params(
         sql: Executable = func(*f_args, **f_kwargs)
     except CancelExecException:
         return None
-    if isinstance(sql, Executable):
-        if not isinstance(sql, Select) and sync_session is not None:
-            sql = sql.execution_options(synchronize_session=sync_session)
+    # The full type check is for development only (skipped with `python -O`), but
+    # None must never be taken for a cancelled execution.
+    if sql is None or (__debug__ and not isinstance(sql, Executable)):
+        raise TypeError(
+            f"Function {func.__name__} returned {type(sql).__name__} "
+            "(expected Executable)"
+        )
+    if sync_session is not None and not is_select_stmt(sql):
+        sql = sql.execution_options(synchronize_session=sync_session)
+    return sql
+
+
+def req_sql_n_params_many(
+    func, f_args, f_kwargs, sync_session: bool | str | None
+) -> tuple[Executable, list[dict]] | None:
+    try:
+        res = func(*f_args, **f_kwargs)
+    except CancelExecException:
+        return None
+    if not (
+        isinstance(res, tuple) and len(res) == 2 and isinstance(res[0], Executable)
+    ):
+        raise TypeError(
+            f"Function {func.__name__} returned {type(res).__name__} "
+            "(expected tuple of Executable and list of parameters)"
+        )
+    sql, params = res
+    if sync_session is not None and not is_select_stmt(sql):
+        sql = sql.execution_options(synchronize_session=sync_session)
+    return sql, params
+
+
+class _NotCached(Exception):
+    """Raised inside the statement cache to leave a cancelled call out of it"""
+
+
+def stmt_builder(
+    func, sync_session: bool | str | None, cache_size: int | None = None
+) -> Callable[[tuple, dict], Executable | None]:
+    """
+    Makes `req_sql_n_params` for the decorated function, called as
+    `builder(f_args, f_kwargs)`. If `cache_size` is set, statements are memoized by
+    the function arguments (compared by equality and type, so `1`, `True` and `1.0`
+    are different keys), so the function must depend on its arguments only. Calls
+    with unhashable arguments and cancelled calls (`CancelExecException`) are not
+    cached. For a function without parameters the only statement is simply kept.
+    """
+    if not cache_size:
+        return partial(req_sql_n_params, func, sync_session=sync_session)
+
+    if not inspect.signature(func).parameters:
+        # No parameters: there is just one statement to keep
+        const_stmt: list[Executable] = []
+
+        def const_builder(f_args: tuple, f_kwargs: dict) -> Executable | None:
+            if const_stmt and not f_args and not f_kwargs:
+                return const_stmt[0]
+            sql = req_sql_n_params(func, f_args, f_kwargs, sync_session)
+            if sql is not None and not f_args and not f_kwargs:
+                const_stmt[:] = [sql]
+            return sql
+
+        return const_builder
+
+    @lru_cache(maxsize=cache_size)
+    def cached(key: tuple) -> Executable:
+        sql = req_sql_n_params(func, key[0], dict(key[2]), sync_session)
+        if sql is None:
+            raise _NotCached
         return sql
-    raise TypeError(
-        f"Function {func.__name__} returned {type(sql).__name__} (expected Executable)"
-    )
+
+    def builder(f_args: tuple, f_kwargs: dict) -> Executable | None:
+        key = (
+            f_args,
+            tuple(map(type, f_args)),
+            tuple(f_kwargs.items()),
+            tuple(map(type, f_kwargs.values())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return req_sql_n_params(func, f_args, f_kwargs, sync_session)
+        try:
+            return cached(key)
+        except _NotCached:
+            return None
+
+    return builder
+
+
+_is_select_by_type: dict[type, bool] = {}
+
+
+def is_select_stmt(sql_stmt: Executable) -> bool:
+    """
+    True for SELECT-like statements (no commit is needed after them). The answer is
+    cached by the statement class: the same decorated function nearly always
+    produces statements of the same class.
+    """
+    stmt_type = type(sql_stmt)
+    res = _is_select_by_type.get(stmt_type)
+    if res is None:
+        res = _is_select_by_type[stmt_type] = issubclass(stmt_type, GenerativeSelect)
+    return res
+
+
+_DEFERRED_COMMIT_KEY = "noorm.deferred_commit"
+
+
+def start_deferred_commit(session_info: dict) -> bool:
+    """
+    Marks the session (by its `info` dict) as deferring commits. Returns False if it
+    is already marked, i.e. for a nested block.
+    """
+    if _DEFERRED_COMMIT_KEY in session_info:
+        return False
+    session_info[_DEFERRED_COMMIT_KEY] = False
+    return True
+
+
+def finish_deferred_commit(session_info: dict) -> bool:
+    """Unmarks the session. Returns True if some commit was deferred."""
+    return session_info.pop(_DEFERRED_COMMIT_KEY, False)
+
+
+def defer_commit(session_info: dict) -> bool:
+    """
+    If the session defers commits, remembers that a commit is pending and returns
+    True. Otherwise returns False, and the caller must commit itself.
+    """
+    if _DEFERRED_COMMIT_KEY in session_info:
+        session_info[_DEFERRED_COMMIT_KEY] = True
+        return True
+    return False
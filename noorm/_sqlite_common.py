@@ -2,10 +2,11 @@ from typing import Type, Any, Callable, Collection, Mapping
 from dataclasses import is_dataclass, fields
 from decimal import Decimal
 from datetime import date, datetime
-from functools import partial
+from functools import partial, lru_cache
 import re
 
-from ._db_api_2 import req_sql_n_params
+from ._common import make_row_builder
+from ._db_api_2 import req_sql_n_params, req_sql_n_params_many
 
 
 def _decode_date(val: str | date | datetime | None) -> date | None:
@@ -28,10 +29,6 @@ def _decode_datetime(val: str | date | datetime | None) -> datetime | None:
     return datetime.fromisoformat(val)
 
 
-def _as_is(val: Any) -> Any:
-    return val
-
-
 def _as_is_val(type_: Type, val: Any) -> Any:
     if val is None:
         return None
@@ -40,9 +37,16 @@ def _as_is_val(type_: Type, val: Any) -> Any:
     return type_(val)
 
 
-def make_scalar_decoder(type_: Type) -> Callable[[Any], Any]:
+def _unknown_column(name: str, val: Any) -> Any:
+    # The same error as the dict-based decoding raised for a column that is not
+    # a field of the row type, and only when there is a row to decode
+    raise KeyError(name)
+
+
+def make_scalar_decoder(type_: Type) -> Callable[[Any], Any] | None:
+    """Value converter for the `type_`, or None if values are taken as is"""
     if type_ is Any:
-        return _as_is
+        return None
     for ttype in (int, float, str, bool, Decimal):
         if issubclass(ttype, type_):
             return partial(_as_is_val, ttype)
@@ -50,21 +54,33 @@ def make_scalar_decoder(type_: Type) -> Callable[[Any], Any]:
         return _decode_date
     if issubclass(datetime, type_):
         return _decode_datetime
-    return _as_is
-
-
-def make_decoder(row_type: type) -> Callable[[dict], dict]:
-    if is_dataclass(row_type):
-        fields_mapper: dict[str, Callable] = {
-            fld.name: make_scalar_decoder(fld.type) for fld in fields(row_type)
-        }
-
-        def _dataclass_decoder(inp: dict) -> dict:
-            return {k: fields_mapper[k](v) for k, v in inp.items()}
+    return None
+
+
+def column_decoders(
+    row_type: type, col_names: tuple[str, ...]
+) -> tuple[Callable | None, ...] | None:
+    """
+    Decoders of the `row_type` dataclass fields for each column (None for
+    the columns taken as is), or None if no column needs decoding. A column that
+    is not a field raises KeyError when a row is decoded.
+    """
+    if not is_dataclass(row_type):
+        return None
+    by_name = {fld.name: make_scalar_decoder(fld.type) for fld in fields(row_type)}
+    decoders = tuple(
+        by_name[name] if name in by_name else partial(_unknown_column, name)
+        for name in col_names
+    )
+    return decoders if any(decoders) else None
 
-        return _dataclass_decoder
 
-    return _as_is
+@lru_cache(maxsize=2048)
+def make_sqlite_row_builder(
+    row_type: type, col_names: tuple[str, ...]
+) -> Callable[[Any], Any]:
+    """`make_row_builder` that also decodes the values for `row_type`"""
+    return make_row_builder(row_type, col_names, column_decoders(row_type, col_names))
 
 
 def _encode_val(val: Any) -> Any:
@@ -208,15 +224,30 @@ def _prepare_positional_params(sql: str, params: tuple) -> tuple[str, tuple]:
     return res_sql, tuple(res_params)
 
 
+def _prepare_sql_n_params(
+    sql_n_params: tuple[str, dict | tuple]
+) -> tuple[str, dict | tuple]:
+    sql, params = sql_n_params
+    if not params:
+        return sql_n_params  # nothing to encode or propagate
+    if isinstance(params, dict):
+        return _prepare_named_params(sql, params)
+    return _prepare_positional_params(sql, params)
+
+
 def sqlite_sql_n_params(
     func, f_args, f_kwargs, default_sql: str | None
 ) -> tuple[str, dict | tuple] | None:
     sql_n_params = req_sql_n_params(func, f_args, f_kwargs, default_sql)
     if sql_n_params is None:
         return None
-    sql, params = sql_n_params
-    if isinstance(params, dict):
-        sql, params = _prepare_named_params(sql, params)
-    else:
-        sql, params = _prepare_positional_params(sql, params)
-    return sql, params
+    return _prepare_sql_n_params(sql_n_params)
+
+
+def sqlite_sql_n_params_many(
+    func, f_args, f_kwargs, default_sql: str | None
+) -> list[tuple[str, dict | tuple]]:
+    return [
+        _prepare_sql_n_params(sql_n_params)
+        for sql_n_params in req_sql_n_params_many(func, f_args, f_kwargs, default_sql)
+    ]
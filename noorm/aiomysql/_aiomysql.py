@@ -2,9 +2,9 @@ from typing import Type, Callable, AsyncGenerator, ParamSpec, TypeVar, Any, Coro
 from typing import Concatenate, overload
 from aiomysql import Connection
 
-from .._common import WrapperBase, ParamsAutoEnum
+from .._common import WrapperBase, ParamsAutoEnum, _first_column
 from .._db_api_2 import PrepareFuncResult, req_sql_n_params
-from ..registry import MetricsCollector
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 TR = TypeVar("TR")
@@ -32,17 +32,16 @@ def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
             async def __call__(
                 self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         async with conn.cursor() as cur:
                             await cur.execute(*sql_and_params)
-                            col_names = tuple(el[0] for el in cur.description)
-                            res: list[TR] = [
-                                row_type(**{n: v for n, v in zip(col_names, r)})
-                                async for r in cur
-                            ]
+                            build = self._row_builder(
+                                row_type, tuple(map(_first_column, cur.description))
+                            )
+                            res: list[TR] = [build(r) async for r in cur]
                             mc.tuples = len(res)
                             return res
                 return []
@@ -75,19 +74,21 @@ def sql_iterate(row_type: Type[TR], sql: str | None = None):
             async def __call__(
                 self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> AsyncGenerator[TR, None]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         async with conn.cursor() as cur:
                             await cur.execute(*sql_and_params)
-                            col_names = tuple(el[0] for el in cur.description)
+                            build = self._row_builder(
+                                row_type, tuple(map(_first_column, cur.description))
+                            )
                             is_first_row = True
                             async for r in cur:
                                 if is_first_row:
                                     mc.finish(None)
                                     is_first_row = False
-                                yield row_type(**{n: v for n, v in zip(col_names, r)})
+                                yield build(r)
 
         return wrapper(func)
 
@@ -116,19 +117,19 @@ def sql_one_or_none(row_type: Type[TR], sql: str | None = None):
             async def __call__(
                 self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         async with conn.cursor() as cur:
                             await cur.execute(*sql_and_params)
-                            col_names = tuple(el[0] for el in cur.description)
+                            build = self._row_builder(
+                                row_type, tuple(map(_first_column, cur.description))
+                            )
                             row = await cur.fetchone()
                             if row is not None:
                                 mc.tuples = 1
-                                return row_type(
-                                    **{n: v for n, v in zip(col_names, row)}
-                                )
+                                return build(row)
                     return None
 
         return wrapper(func)
@@ -159,7 +160,7 @@ def sql_scalar_or_none(res_type: Type[TR], sql: str | None = None):
             async def __call__(
                 self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -200,7 +201,7 @@ def sql_fetch_scalars(res_type: Type[TR], sql: str | None = None):
             async def __call__(
                 self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -241,7 +242,7 @@ def sql_iterate_scalars(res_type: Type[TR], sql: str | None = None):
             async def __call__(
                 self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> AsyncGenerator[TR, None]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -305,7 +306,7 @@ def sql_execute(  # type: ignore
                 async def __call__(
                     self, conn: Connection, *args: F_Spec.args, **kwargs: F_Spec.kwargs
                 ) -> None:
-                    with MetricsCollector(self._func):
+                    with collect_metrics(self._func):
                         if sql_and_params := req_sql_n_params(
                             self._func, args, kwargs, sql
                         ):
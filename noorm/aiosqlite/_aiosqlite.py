@@ -1,22 +1,202 @@
 from typing import Type, Callable, AsyncGenerator, ParamSpec, TypeVar, Concatenate
-from typing import Coroutine, Any
+from typing import Coroutine, Any, Iterable
 from typing import overload
 import aiosqlite
 
-from .._common import WrapperBase, ParamsAutoEnum
+from .._common import WrapperBase, ParamsAutoEnum, _first_column
 from .._sqlite_common import (
-    make_decoder as _make_decoder,
     make_scalar_decoder as _make_scalar_decoder,
+    make_sqlite_row_builder,
     sqlite_sql_n_params,
+    sqlite_sql_n_params_many,
 )
 from .._db_api_2 import PrepareFuncResult
-from ..registry import MetricsCollector
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 TR = TypeVar("TR")
 ConnectionOrCursor = aiosqlite.Connection | aiosqlite.Cursor
 
 
+class _SqliteWrapper(WrapperBase):
+    """Base of the aiosqlite wrappers. Configuration is stored once per decoration."""
+
+    __slots__ = ("_row_type", "_sql")
+
+    def __init__(self, func: Callable, row_type: type | None, sql: str | None) -> None:
+        super().__init__(func)
+        self._row_type = row_type
+        self._sql = sql
+
+
+class _ScalarWrapper(_SqliteWrapper):
+    __slots__ = ("_decoder",)
+
+    def __init__(self, func: Callable, res_type: type, sql: str | None) -> None:
+        super().__init__(func, res_type, sql)
+        self._decoder = _make_scalar_decoder(res_type)
+
+
+class _FetchAllWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    async def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = await conn.execute(*sql_and_params)
+                build = self._row_builder(
+                    self._row_type,
+                    tuple(map(_first_column, q_res.description)),
+                    make_sqlite_row_builder,
+                )
+                res = list(map(build, await q_res.fetchall()))
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _FetchAllManyWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    async def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            res: list = []
+            if sqls_and_params := sqlite_sql_n_params_many(
+                self._func, args, kwargs, self._sql
+            ):
+                if isinstance(conn, aiosqlite.Connection):
+                    # One cursor for all the statements, closed at the end
+                    async with conn.cursor() as cur:
+                        await self._fetch_into(res, cur, sqls_and_params)
+                else:
+                    await self._fetch_into(res, conn, sqls_and_params)
+            mc.tuples = len(res)
+            return res
+
+    async def _fetch_into(
+        self, res: list, cur: aiosqlite.Cursor, sqls_and_params: list
+    ) -> None:
+        for sql_and_params in sqls_and_params:
+            q_res = await cur.execute(*sql_and_params)
+            build = self._row_builder(
+                self._row_type,
+                tuple(map(_first_column, q_res.description)),
+                make_sqlite_row_builder,
+            )
+            res.extend(map(build, await q_res.fetchall()))
+
+
+class _IterateWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    async def __call__(
+        self, conn: aiosqlite.Connection, *args, **kwargs
+    ) -> AsyncGenerator:
+        # Metrics cover the statement execution only, so they are complete before
+        # the first row is yielded.
+        with collect_metrics(self._func):
+            sql_and_params = sqlite_sql_n_params(self._func, args, kwargs, self._sql)
+            if not sql_and_params:
+                return
+            cur = await conn.cursor()
+            q_res = await cur.execute(*sql_and_params)
+            build = self._row_builder(
+                self._row_type,
+                tuple(map(_first_column, q_res.description)),
+                make_sqlite_row_builder,
+            )
+        # Own fetchmany loop: one async generator less per row than `async for`
+        size = q_res.iter_chunk_size
+        while rows := await q_res.fetchmany(size):
+            for r in rows:
+                yield build(r)
+
+
+class _OneOrNoneWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    async def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = await conn.execute(*sql_and_params)
+                if (row := await q_res.fetchone()) is not None:
+                    mc.tuples = 1
+                    return self._row_builder(
+                        self._row_type,
+                        tuple(map(_first_column, q_res.description)),
+                        make_sqlite_row_builder,
+                    )(row)
+            return None
+
+
+class _ScalarOrNoneWrapper(_ScalarWrapper):
+    __slots__ = ()
+
+    async def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = await conn.execute(*sql_and_params)
+                if (row := await q_res.fetchone()) is not None:
+                    mc.tuples = 1
+                    decoder = self._decoder
+                    return row[0] if decoder is None else decoder(row[0])
+            return None
+
+
+class _FetchScalarsWrapper(_ScalarWrapper):
+    __slots__ = ()
+
+    async def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = await conn.execute(*sql_and_params)
+                values = map(_first_column, await q_res.fetchall())
+                decoder = self._decoder
+                res = list(values if decoder is None else map(decoder, values))
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _IterateScalarsWrapper(_ScalarWrapper):
+    __slots__ = ()
+
+    async def __call__(
+        self, conn: aiosqlite.Connection, *args, **kwargs
+    ) -> AsyncGenerator:
+        with collect_metrics(self._func):
+            sql_and_params = sqlite_sql_n_params(self._func, args, kwargs, self._sql)
+            if not sql_and_params:
+                return
+            cur = await conn.cursor()
+            q_res = await cur.execute(*sql_and_params)
+        decoder = self._decoder
+        size = q_res.iter_chunk_size
+        while rows := await q_res.fetchmany(size):
+            values = map(_first_column, rows)
+            for v in values if decoder is None else map(decoder, values):
+                yield v
+
+
+class _ExecuteWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    async def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> None:
+        with collect_metrics(self._func):
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                await conn.execute(*sql_and_params)
+
+
 def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
     """
     Use this decorator to make a "fetch all" SQL statement executor out of
@@ -37,30 +217,34 @@ def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
     ) -> Callable[
         Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, list[TR]]
     ]:
-        decoder = _make_decoder(row_type)
-
-        class wrapper(WrapperBase):
-            async def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = await conn.execute(*sql_and_params)
-                        col_names = tuple(el[0] for el in q_res.description)
-                        res: list[TR] = [
-                            row_type(**decoder({n: v for n, v in zip(col_names, r)}))
-                            async for r in q_res
-                        ]
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchAllWrapper(func, row_type, sql)
+
+    return decorator
+
+
+def sql_fetch_all_many(row_type: Type[TR], sql: str | None = None):
+    """
+    Use this decorator to run a query with several parameter sets and fetch all the
+    results as one list. The decorated function returns a collection (e.g. a list)
+    of `nm.params`, `nm.query_and_params`, or `nm.query_only` results. The statements
+    are executed one by one on the same cursor.
+
+    :param row_type: type of expected result. Usually some dataclass or named tuple
+    :param sql: SQL statement to execute. If None, the SQL statement must be provided
+    by decorated function.
+
+    IMPORTANT: decorated function must not be async, but after decoration it
+    becomes async.
+
+    More info in the noorm.aiosqlite docstring.
+    """
+
+    def decorator(
+        func: Callable[F_Spec, Iterable[PrepareFuncResult]]
+    ) -> Callable[
+        Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, list[TR]]
+    ]:
+        return _FetchAllManyWrapper(func, row_type, sql)
 
     return decorator
 
@@ -84,32 +268,7 @@ def sql_iterate(row_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[aiosqlite.Connection, F_Spec], AsyncGenerator[TR, None]]:
-        decoder = _make_decoder(row_type)
-
-        class wrapper(WrapperBase):
-            async def __call__(
-                self,
-                conn: aiosqlite.Connection,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> AsyncGenerator[TR, None]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        cur = await conn.cursor()
-                        q_res = await cur.execute(*sql_and_params)
-                        col_names = tuple(el[0] for el in q_res.description)
-                        is_first_row = True
-                        async for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield row_type(
-                                **decoder({n: v for n, v in zip(col_names, r)})
-                            )
-
-        return wrapper(func)
+        return _IterateWrapper(func, row_type, sql)
 
     return decorator
 
@@ -134,29 +293,7 @@ def sql_one_or_none(row_type: Type[TR], sql: str | None = None):
     ) -> Callable[
         Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, TR | None]
     ]:
-        decoder = _make_decoder(row_type)
-
-        class wrapper(WrapperBase):
-            async def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = await conn.execute(*sql_and_params)
-                        col_names = tuple(el[0] for el in q_res.description)
-                        async for row in q_res:
-                            mc.tuples = 1
-                            return row_type(
-                                **decoder({n: v for n, v in zip(col_names, row)})
-                            )
-                    return None
-
-        return wrapper(func)
+        return _OneOrNoneWrapper(func, row_type, sql)
 
     return decorator
 
@@ -183,26 +320,7 @@ def sql_scalar_or_none(res_type: Type[TR], sql: str | None = None):
     ) -> Callable[
         Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, TR | None]
     ]:
-        decoder = _make_scalar_decoder(res_type)
-
-        class wrapper(WrapperBase):
-            async def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = await conn.execute(*sql_and_params)
-                        async for row in q_res:
-                            mc.tuples = 1
-                            return decoder(row[0])
-                    return None
-
-        return wrapper(func)
+        return _ScalarOrNoneWrapper(func, res_type, sql)
 
     return decorator
 
@@ -229,26 +347,7 @@ def sql_fetch_scalars(res_type: Type[TR], sql: str | None = None):
     ) -> Callable[
         Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, list[TR]]
     ]:
-        decoder = _make_scalar_decoder(res_type)
-
-        class wrapper(WrapperBase):
-            async def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = await conn.execute(*sql_and_params)
-                        res = [decoder(row[0]) async for row in q_res]
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchScalarsWrapper(func, res_type, sql)
 
     return decorator
 
@@ -271,29 +370,7 @@ def sql_iterate_scalars(res_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[aiosqlite.Connection, F_Spec], AsyncGenerator[TR, None]]:
-        decoder = _make_scalar_decoder(res_type)
-
-        class wrapper(WrapperBase):
-            async def __call__(
-                self,
-                conn: aiosqlite.Connection,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> AsyncGenerator[TR, None]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        cur = await conn.cursor()
-                        q_res = await cur.execute(*sql_and_params)
-                        is_first_row = True
-                        async for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield decoder(r[0])
-
-        return wrapper(func)
+        return _IterateScalarsWrapper(func, res_type, sql)
 
     return decorator
 
@@ -330,37 +407,11 @@ def sql_execute(  # type: ignore
     More info in the noorm.aiosqlite docstring.
     """
     if callable(sql):
-        the_func = sql
-        the_sql = None
-    else:
-        the_func = None
-        the_sql = sql
-
-    def decorator_wrapper(sql: str | None):
-        def decorator(
-            func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
-        ) -> Callable[
-            Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, None]
-        ]:
-            class wrapper(WrapperBase):
-                async def __call__(
-                    self,
-                    conn: ConnectionOrCursor,
-                    *args: F_Spec.args,
-                    **kwargs: F_Spec.kwargs,
-                ) -> None:
-                    with MetricsCollector(self._func):
-                        if sql_and_params := sqlite_sql_n_params(
-                            self._func, args, kwargs, sql
-                        ):
-                            await conn.execute(*sql_and_params)
-
-            return wrapper(func)
-
-        return decorator
-
-    wrap_decorator = decorator_wrapper(the_sql)
-    if callable(sql):
-        return wrap_decorator(the_func)
-    else:
-        return wrap_decorator
+        return _ExecuteWrapper(sql, None, None)
+
+    def decorator(
+        func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
+    ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], Coroutine[Any, Any, None]]:
+        return _ExecuteWrapper(func, None, sql)
+
+    return decorator
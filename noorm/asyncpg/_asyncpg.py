@@ -5,7 +5,7 @@ import asyncpg
 
 from .._common import WrapperBase, ParamsAutoEnum
 from .._db_api_2_args_only import PrepareFuncResult, req_sql_n_params
-from ..registry import MetricsCollector
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 TR = TypeVar("TR")
@@ -38,14 +38,12 @@ def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
                 *args: F_Spec.args,
                 **kwargs: F_Spec.kwargs,
             ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         q_res = await conn.fetch(sql_and_params[0], *sql_and_params[1])
-                        res: list[TR] = [
-                            row_type(**{n: v for n, v in r.items()}) for r in q_res
-                        ]
+                        res: list[TR] = [row_type(**r) for r in q_res]
                         mc.tuples = len(res)
                         return res
                     return []
@@ -82,7 +80,7 @@ def sql_one_or_none(row_type: Type[TR], sql: str | None = None):
                 *args: F_Spec.args,
                 **kwargs: F_Spec.kwargs,
             ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -94,7 +92,7 @@ def sql_one_or_none(row_type: Type[TR], sql: str | None = None):
                     if q_res is None:
                         return None
                     mc.tuples = 1
-                    return row_type(**{n: v for n, v in q_res.items()})
+                    return row_type(**q_res)
 
         return wrapper(func)
 
@@ -129,7 +127,7 @@ def sql_scalar_or_none(res_type: Type[TR], sql: str | None = None):
                 *args: F_Spec.args,
                 **kwargs: F_Spec.kwargs,
             ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -176,7 +174,7 @@ def sql_fetch_scalars(res_type: Type[TR], sql: str | None = None):
                 *args: F_Spec.args,
                 **kwargs: F_Spec.kwargs,
             ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -243,7 +241,7 @@ def sql_execute(  # type: ignore
                     *args: F_Spec.args,
                     **kwargs: F_Spec.kwargs,
                 ) -> None:
-                    with MetricsCollector(self._func):
+                    with collect_metrics(self._func):
                         if sql_and_params := req_sql_n_params(
                             self._func, args, kwargs, sql
                         ):
@@ -5,9 +5,9 @@ NoORM (Not Only ORM) helpers for psycopg2
 from typing import Type, Callable, Generator, ParamSpec, TypeVar, Concatenate
 from typing import Any, overload
 
-from .._common import WrapperBase, ParamsAutoEnum
+from .._common import WrapperBase, ParamsAutoEnum, _first_column
 from .._db_api_2 import PrepareFuncResult, req_sql_n_params
-from ..registry import MetricsCollector
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 TR = TypeVar("TR")
@@ -33,17 +33,16 @@ def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
             def __call__(
                 self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         with conn.cursor() as cur:
                             cur.execute(*sql_and_params)
-                            col_names = tuple(el[0] for el in cur.description)
-                            res: list[TR] = [
-                                row_type(**{n: v for n, v in zip(col_names, r)})
-                                for r in cur
-                            ]
+                            build = self._row_builder(
+                                row_type, tuple(map(_first_column, cur.description))
+                            )
+                            res: list[TR] = list(map(build, cur))
                             mc.tuples = len(res)
                             return res
                     return []
@@ -73,19 +72,21 @@ def sql_iterate(row_type: Type[TR], sql: str | None = None):
             def __call__(
                 self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> Generator[TR, None, None]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         with conn.cursor() as cur:
                             cur.execute(*sql_and_params)
-                            col_names = tuple(el[0] for el in cur.description)
+                            build = self._row_builder(
+                                row_type, tuple(map(_first_column, cur.description))
+                            )
                             is_first_row = True
                             for r in cur:
                                 if is_first_row:
                                     mc.finish(None)
                                     is_first_row = False
-                                yield row_type(**{n: v for n, v in zip(col_names, r)})
+                                yield build(r)
 
         return wrapper(func)
 
@@ -111,18 +112,18 @@ def sql_one_or_none(row_type: Type[TR], sql: str | None = None):
             def __call__(
                 self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         with conn.cursor() as cur:
                             cur.execute(*sql_and_params)
-                            col_names = tuple(el[0] for el in cur.description)
+                            build = self._row_builder(
+                                row_type, tuple(map(_first_column, cur.description))
+                            )
                             for row in cur:
                                 mc.tuples = 1
-                                return row_type(
-                                    **{n: v for n, v in zip(col_names, row)}
-                                )
+                                return build(row)
                     return None
 
         return wrapper(func)
@@ -150,7 +151,7 @@ def sql_scalar_or_none(res_type: Type[TR], sql: str | None = None):
             def __call__(
                 self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -187,13 +188,13 @@ def sql_fetch_scalars(res_type: Type[TR], sql: str | None = None):
             def __call__(
                 self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
                         with conn.cursor() as cur:
                             cur.execute(*sql_and_params)
-                            res: list[TR] = [r[0] for r in cur]
+                            res: list[TR] = list(map(_first_column, cur))
                             mc.tuples = len(res)
                             return res
                     return []
@@ -225,7 +226,7 @@ def sql_iterate_scalars(res_type: Type[TR], sql: str | None = None):
             def __call__(
                 self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
             ) -> Generator[TR, None, None]:
-                with MetricsCollector(self._func) as mc:
+                with collect_metrics(self._func) as mc:
                     if sql_and_params := req_sql_n_params(
                         self._func, args, kwargs, sql
                     ):
@@ -288,7 +289,7 @@ def sql_execute(  # type: ignore
                 def __call__(
                     self, conn, *args: F_Spec.args, **kwargs: F_Spec.kwargs
                 ) -> None:
-                    with MetricsCollector(self._func):
+                    with collect_metrics(self._func):
                         if sql_and_params := req_sql_n_params(
                             self._func, args, kwargs, sql
                         ):
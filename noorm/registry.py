@@ -2,13 +2,19 @@ import logging
 from typing import Callable
 from dataclasses import dataclass, field
 from collections import defaultdict
-from functools import lru_cache
 from time import perf_counter
 from multiprocessing import current_process
-from threading import Thread
+from threading import Thread, Lock, Event
+from queue import SimpleQueue
 import socket
 import os
 import pickle
+import tempfile
+import atexit
+
+
+# sun_path is 104 bytes on macOS and 108 on Linux, including the trailing zero
+_MAX_UNIX_SOCKET_PATH = 103
 
 
 @dataclass
@@ -33,21 +39,71 @@ class Registry:
         self.name_by_func: dict[Callable, str] = {}
         self.func_names: set[str] = set()
         self.stat_by_name: defaultdict[str, Stat] = defaultdict(Stat)
+        # Events are aggregated by the calling threads and by the multiprocess
+        # listener thread
+        self._stat_lock = Lock()
         self._event_listeners: list[Callable[[FuncCallEvent], None]] = []
+        self._bg_event_listeners: list[Callable[[FuncCallEvent], None]] = []
+        self._bg_queue: SimpleQueue[FuncCallEvent | Event] = SimpleQueue()
+        self._bg_thread: Thread | None = None
+        self._bg_lock = Lock()
         self._mp_listener_started = False
+        self._mp_owner_pid: int | None = None
         self._is_main_process = current_process().name == "MainProcess"
         self._mp_socket: socket.socket | None = None
-        self._mp_port = 0
+        # Unix socket path, or ("localhost", port) where AF_UNIX is not available
+        self._mp_address: str | tuple[str, int] | None = None
+        self._collect_stat = True
+        self.metrics_enabled = True
+        # Messages of a child process dropped because the main process socket
+        # buffer was full
+        self.mp_dropped_events = 0
         if not self._is_main_process:
-            self._mp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            reg_socket_path = os.getenv("NOORM_REGISTRY_SOCKET")
             reg_port = int(os.getenv("NOORM_REGISTRY_PORT") or "0")
-            if reg_port == 0:
-                logging.warning(
-                    "Noorm works in a child process, but 'init_multiprocess_registry' "
-                    "on a main process was not invoked. All statistics on this child "
-                    "process will be lost."
-                )
-            self._mp_port = reg_port
+            if reg_socket_path:
+                self._mp_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._mp_address = reg_socket_path
+            else:
+                self._mp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                if reg_port:
+                    self._mp_address = ("localhost", reg_port)
+                else:
+                    logging.warning(
+                        "Noorm works in a child process, but "
+                        "'init_multiprocess_registry' on a main process was not "
+                        "invoked. All statistics on this child process will be lost."
+                    )
+            # Never wait for a busy main process: DB calls must not be delayed
+            self._mp_socket.setblocking(False)
+        self._update_metrics_enabled()
+
+    def _update_metrics_enabled(self) -> None:
+        if self._is_main_process:
+            self.metrics_enabled = bool(
+                self._collect_stat
+                or self._event_listeners
+                or self._bg_event_listeners
+            )
+        else:
+            # A child process only forwards events to the main process
+            self.metrics_enabled = bool(
+                self._mp_address and self._mp_socket is not None
+            )
+
+    @property
+    def collect_stat(self) -> bool:
+        """
+        Whether `stat_by_name` statistics are collected. True by default. If it is
+        switched off and there are no event listeners, DB API functions are called
+        without any time measurement.
+        """
+        return self._collect_stat
+
+    @collect_stat.setter
+    def collect_stat(self, value: bool) -> None:
+        self._collect_stat = value
+        self._update_metrics_enabled()
 
     def _main_process_socket_listener(self) -> None:
         while self._mp_socket is not None:
@@ -67,6 +123,21 @@ class Registry:
             except Exception:
                 pass  # do nothing
 
+    @staticmethod
+    def _new_unix_socket_path() -> str | None:
+        """
+        Path for the Unix socket in a new private directory. None if there are no
+        Unix sockets or the path does not fit in `sun_path` (e.g. long TMPDIR).
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        sock_dir = tempfile.mkdtemp(prefix="noorm-")
+        sock_path = os.path.join(sock_dir, "registry.sock")
+        if len(os.fsencode(sock_path)) > _MAX_UNIX_SOCKET_PATH:
+            os.rmdir(sock_dir)
+            return None
+        return sock_path
+
     def init_multiprocess_registry(self) -> None:
         if not self._mp_listener_started:
             if not self._is_main_process:
@@ -74,71 +145,162 @@ class Registry:
                     "Cannot init multiprocess noorm registry in a child process"
                 )
                 return
-            self._mp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._mp_socket.bind(("localhost", 0))
-            self._mp_port = self._mp_socket.getsockname()[1]
-            os.environ["NOORM_REGISTRY_PORT"] = str(self._mp_port)
+            sock_path = self._new_unix_socket_path()
+            if sock_path is not None:
+                # Unix datagrams do not go through the IP stack
+                self._mp_address = sock_path
+                self._mp_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._mp_socket.bind(self._mp_address)
+                os.environ["NOORM_REGISTRY_SOCKET"] = self._mp_address
+            else:
+                self._mp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._mp_socket.bind(("localhost", 0))
+                self._mp_address = ("localhost", self._mp_socket.getsockname()[1])
+                os.environ["NOORM_REGISTRY_PORT"] = str(self._mp_address[1])
             self._mp_listener_started = True
+            self._mp_owner_pid = os.getpid()
+            atexit.register(self._close_multiprocess_registry_at_exit)
             Thread(target=self._main_process_socket_listener, daemon=True).start()
 
+    def _close_multiprocess_registry_at_exit(self) -> None:
+        # Forked children inherit atexit handlers, but the socket is not theirs
+        if os.getpid() == self._mp_owner_pid:
+            self.close_multiprocess_registry()
+
     def close_multiprocess_registry(self) -> None:
-        """Mainly for testing purposes"""
-        if self._mp_listener_started:
-            socket.socket(socket.AF_INET, socket.SOCK_DGRAM).sendto(
-                pickle.dumps("#stop#"), ("localhost", self._mp_port)
-            )
-            del os.environ["NOORM_REGISTRY_PORT"]
+        """
+        Stops listening to child processes and removes the socket file. It is also
+        done automatically on exit.
+        """
+        if self._mp_listener_started and self._mp_address is not None:
+            atexit.unregister(self._close_multiprocess_registry_at_exit)
+            if isinstance(self._mp_address, str):
+                with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as stop_socket:
+                    stop_socket.sendto(pickle.dumps("#stop#"), self._mp_address)
+                del os.environ["NOORM_REGISTRY_SOCKET"]
+                try:
+                    os.unlink(self._mp_address)
+                    os.rmdir(os.path.dirname(self._mp_address))
+                except OSError:
+                    pass  # do nothing
+            else:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as stop_socket:
+                    stop_socket.sendto(pickle.dumps("#stop#"), self._mp_address)
+                del os.environ["NOORM_REGISTRY_PORT"]
+            self._mp_address = None
             self._mp_listener_started = False
 
+    def get_stat(self, func_name: str) -> Stat:
+        """
+        Statistics of one function. All zeros if it was not called yet. Unlike
+        `stat_by_name[func_name]`, it does not add an entry for an unknown name.
+        """
+        return self.stat_by_name.get(func_name) or Stat()
+
     def register(self, func: Callable) -> str:
         func_name = func.__module__ + "." + func.__qualname__
         self.func_names.add(func_name)
         self.name_by_func[func] = func_name
-        if not self._is_main_process and self._mp_port and self._mp_socket is not None:
+        if (
+            not self._is_main_process
+            and self._mp_address
+            and self._mp_socket is not None
+        ):
             try:
-                self._mp_socket.sendto(
-                    pickle.dumps(func_name), ("localhost", self._mp_port)
-                )
+                self._mp_socket.sendto(pickle.dumps(func_name), self._mp_address)
+            except BlockingIOError:
+                self.mp_dropped_events += 1
             except Exception:
                 pass  # do nothing
         return func_name
 
-    def add_event_listener(self, callback: Callable[[FuncCallEvent], None]) -> None:
-        self._event_listeners.append(callback)
+    def add_event_listener(
+        self, callback: Callable[[FuncCallEvent], None], background: bool = False
+    ) -> None:
+        """
+        Adds a callback invoked on every DB API function call.
 
-    def on_event(self, event: FuncCallEvent) -> None:
-        if not self._is_main_process:
-            if self._mp_port and self._mp_socket is not None:
-                try:
-                    self._mp_socket.sendto(
-                        pickle.dumps(event), ("localhost", self._mp_port)
+        :param background: if True, the callback is invoked in a separate daemon
+        thread, so a slow listener does not delay the DB API function itself.
+        """
+        if not background:
+            self._event_listeners.append(callback)
+        else:
+            with self._bg_lock:
+                self._bg_event_listeners.append(callback)
+                if self._bg_thread is None:
+                    self._bg_thread = Thread(
+                        target=self._bg_listeners_worker, daemon=True
                     )
+                    self._bg_thread.start()
+        self._update_metrics_enabled()
+
+    def _bg_listeners_worker(self) -> None:
+        while True:
+            item = self._bg_queue.get()
+            if isinstance(item, Event):
+                item.set()
+                continue
+            for callback in self._bg_event_listeners:
+                try:
+                    callback(item)
                 except Exception:
-                    pass  # do nothing
-        else:
+                    pass  # Just ignore all the fails in external listeners
+
+    def wait_background_listeners(self, timeout: float | None = None) -> bool:
+        """
+        Waits until background listeners process all the events that happened
+        before this call. Returns False on timeout.
+        """
+        if self._bg_thread is None:
+            return True
+        done = Event()
+        self._bg_queue.put(done)
+        return done.wait(timeout)
+
+    def _add_to_stat(self, event: FuncCallEvent) -> None:
+        with self._stat_lock:
             stat = self.stat_by_name[event.func_name]
             stat.calls += 1
-            stat.duration += event.duration or 0
+            if event.duration:
+                stat.duration += event.duration
             stat.tuples += event.tuples
             if event.error:
                 stat.fails += 1
-                stat.fails_by_error[event.error] = (
-                    stat.fails_by_error.get(event.error, 0) + 1
-                )
+                fails_by_error = stat.fails_by_error
+                fails_by_error[event.error] = fails_by_error.get(event.error, 0) + 1
+
+    def on_event(self, event: FuncCallEvent) -> None:
+        if not self._is_main_process:
+            if self._mp_address and self._mp_socket is not None:
+                try:
+                    self._mp_socket.sendto(pickle.dumps(event), self._mp_address)
+                except BlockingIOError:
+                    self.mp_dropped_events += 1
+                except Exception:
+                    pass  # do nothing
+        else:
+            if self._collect_stat:
+                self._add_to_stat(event)
 
             for callback in self._event_listeners:
                 try:
                     callback(event)
                 except Exception:
                     pass  # Just ignore all the fails in external listeners
+            if self._bg_thread is not None:
+                self._bg_queue.put(event)
 
     def clear_stat(self) -> None:
-        self.stat_by_name.clear()
+        with self._stat_lock:
+            self.stat_by_name.clear()
 
 
 class MetricsCollector:
-    def __init__(self, func: Callable) -> None:
-        self.registry = get_registry()
+    __slots__ = ("registry", "func", "tuples", "start_time")
+
+    def __init__(self, func: Callable, registry: Registry | None = None) -> None:
+        self.registry = registry or get_registry()
         self.func = func
         self.tuples = 0
         self.start_time: float | None = None
@@ -167,10 +329,53 @@ class MetricsCollector:
         self.finish(exc_type)
 
 
-@lru_cache
-def _get_registry(pid):
-    return Registry()
+_registry: Registry | None = None
+
+
+def _forget_registry() -> None:
+    # A forked child must not reuse the registry inherited from the parent
+    global _registry
+    _registry = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_registry)
+
+
+def get_registry() -> Registry:
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
+
+
+class _NoMetrics:
+    """MetricsCollector replacement for the case when nobody consumes metrics"""
+
+    __slots__ = ("tuples",)
+
+    def __init__(self) -> None:
+        self.tuples = 0
+
+    def finish(self, exc_type: type | None) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_value, traceback) -> None:
+        pass
+
+
+_no_metrics = _NoMetrics()
 
 
-def get_registry():
-    return _get_registry(current_process().pid)
+def collect_metrics(func: Callable) -> MetricsCollector | _NoMetrics:
+    """
+    Context manager that measures a DB API function call. A no-op one is returned
+    when statistics are switched off and there are no event listeners.
+    """
+    registry = get_registry()
+    if registry.metrics_enabled:
+        return MetricsCollector(func, registry)
+    return _no_metrics
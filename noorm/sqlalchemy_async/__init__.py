@@ -2,8 +2,8 @@
 NoORM adapter for asynchronous SQLAlchemy.
 
 Decorators:
-- `sql_fetch_all(row_type: type, no_commit: bool, sync_session: bool | str | None)`
-  to fetch records as a list
+- `sql_fetch_all(row_type: type, no_commit: bool, sync_session: bool | str | None,
+  stream_chunk_size: int | None)` to fetch records as a list
 - `sql_one_or_none(res_type: type, no_commit: bool, sync_session: bool | str | None)`
   to fetch one record
 - `sql_scalar_or_none(res_type: type, no_commit: bool, sync_session: bool | str | None)`
@@ -11,6 +11,8 @@ Decorators:
 - `sql_fetch_scalars(res_type: type, no_commit: bool, sync_session: bool | str | None)`
   to fetch a list of scalars
 - `sql_execute(no_commit: bool, sync_session: bool | str | None)` to execute a statement
+- `sql_execute_many(no_commit: bool, sync_session: bool | str | None)` to execute
+  a statement for a list of parameter sets at once
 - `sql_iterate(row_type: type, no_commit: bool, sync_session: bool | str | None)` and
   `sql_iterate_scalars(row_type: type, no_commit: bool, sync_session: bool | str | None)`
   to make a query and iterate through results, objects or scalars respectively.
@@ -28,12 +30,23 @@ Decorator parameters are:
   persistent object in a session, there is nothing to synchronise. If you really need
   different behavior, set this `sync_session` parameter to "fetch" or "evaluate", or
   pass None to turn off the execution option manipulation.
+- (only `sql_fetch_all`) Stream chunk size. If set, rows are read through
+  a server-side cursor by chunks of this size, so the driver never buffers the whole
+  result set. Useful for really big results.
+- Statement cache size. Default None (no caching). If set, statements returned by
+  the decorated function are memoized by its arguments, so the function is not
+  called again for the same arguments. Use it only for functions whose statement
+  depends on nothing but the arguments.
+
+To commit once after several data manipulations, wrap them into
+`async with deferred_commit(session): ...`.
 
 After decoration the decorated function receives an open Session as a first positional
 argument.
 
 Decorated function should return an executable statement (select, insert, update,
-delete).
+delete). For `sql_execute_many` it returns a tuple of a statement and a list of
+parameter dicts.
 
 IMPORTANT: decorated function must not be async, but after decoration it becomes async.
 
@@ -61,12 +74,32 @@ def get_one_user(id_: int):
 def ins_user(username: str | None = None, email: str | None = None):
     return sa.insert(User).values(username=username, email=email)
 
+# Insert many records at once
+@nm.sql_execute_many
+def ins_users(users: list[tuple[str, str]]):
+    return sa.insert(User), [{"username": u, "email": e} for u, e in users]
+
+# Update many records at once. Use bindparam placeholders with names that differ
+# from the column names.
+@nm.sql_execute_many
+def rename_users(names: dict[int, str]):
+    users = User.__table__
+    stmt = (
+        sa.update(users)
+        .where(users.c.id == sa.bindparam("b_id"))
+        .values(username=sa.bindparam("b_username"))
+    )
+    return stmt, [{"b_id": k, "b_username": v} for k, v in names.items()]
+
 # Usage:
     for user in await get_all_users(session):
         print(user)
     print(f"User with id=1: {await get_one_user(session, 1)}")
 
     await ins_user(session, "Jane", "jane@example.com") # Commit is done automatically
+    await ins_users(
+        session, [("John", "john@example.com"), ("Jim", "jim@example.com")]
+    )
 ```
 """  # noqa: E501
 
@@ -78,6 +111,8 @@ from ._sqlalchemy_async import (
     sql_fetch_scalars,
     sql_iterate_scalars,
     sql_execute,
+    sql_execute_many,
+    deferred_commit,
 )
 from noorm._common import CancelExecException
 
@@ -89,5 +124,7 @@ __all__ = [
     "sql_fetch_scalars",
     "sql_iterate_scalars",
     "sql_execute",
+    "sql_execute_many",
+    "deferred_commit",
     "CancelExecException",
 ]
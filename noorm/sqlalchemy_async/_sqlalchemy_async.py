@@ -3,29 +3,229 @@ NoORM (Not Only ORM) helpers for asynchronous sqlalchemy
 """
 
 from typing import Type, Callable, Coroutine, ParamSpec, TypeVar, Any, overload
-from typing import Concatenate, AsyncGenerator
+from typing import Concatenate, AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.sql import Executable
-from sqlalchemy.sql.selectable import GenerativeSelect
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .._sqlalchemy_common import req_sql_n_params
+from .._sqlalchemy_common import stmt_builder, is_select_stmt, defer_commit
+from .._sqlalchemy_common import req_sql_n_params_many
+from .._sqlalchemy_common import start_deferred_commit, finish_deferred_commit
 from .._common import WrapperBase
-from ..registry import MetricsCollector
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 TR = TypeVar("TR")
 
 
-async def _commit_if_needed(
-    session: AsyncSession, sql_stmt: Executable, no_commit: bool
-):
-    if not isinstance(sql_stmt, GenerativeSelect) and not no_commit:
-        await session.commit()
+class _AsyncWrapper(WrapperBase):
+    """Base of the async wrappers. Configuration is stored once per decoration."""
+
+    __slots__ = ("_row_type", "_no_commit", "_req_sql")
+
+    def __init__(
+        self,
+        func: Callable,
+        row_type: type | None,
+        no_commit: bool,
+        sync_session: bool | str | None,
+        stmt_cache_size: int | None,
+    ) -> None:
+        super().__init__(func)
+        self._row_type = row_type
+        self._no_commit = no_commit
+        self._req_sql = stmt_builder(func, sync_session, stmt_cache_size)
+
+
+class _FetchAllWrapper(_AsyncWrapper):
+    __slots__ = ("_stream_chunk_size",)
+
+    def __init__(
+        self,
+        func: Callable,
+        row_type: type | None,
+        no_commit: bool,
+        sync_session: bool | str | None,
+        stmt_cache_size: int | None,
+        stream_chunk_size: int | None,
+    ) -> None:
+        super().__init__(func, row_type, no_commit, sync_session, stmt_cache_size)
+        self._stream_chunk_size = stream_chunk_size
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                if self._stream_chunk_size:
+                    q_stream = await session.stream(sql_stmt)
+                    build = self._row_builder(self._row_type, tuple(q_stream.keys()))
+                    res = []
+                    async for part in q_stream.partitions(self._stream_chunk_size):
+                        res.extend(map(build, part))
+                else:
+                    q_res = await session.execute(sql_stmt)
+                    build = self._row_builder(self._row_type, tuple(q_res.keys()))
+                    res = list(map(build, q_res))
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.sync_session.info)
+                ):
+                    await session.commit()
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _IterateWrapper(_AsyncWrapper):
+    __slots__ = ()
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> AsyncGenerator:
+        # The result is already buffered by `session.execute`, so the metrics are
+        # complete before the first row is yielded.
+        with collect_metrics(self._func):
+            sql_stmt = self._req_sql(args, kwargs)
+            if sql_stmt is None:
+                return
+            q_res = await session.execute(sql_stmt)
+            build = self._row_builder(self._row_type, tuple(q_res.keys()))
+        for r in q_res:
+            yield build(r)
+        if (
+            not self._no_commit
+            and not is_select_stmt(sql_stmt)
+            and not defer_commit(session.sync_session.info)
+        ):
+            await session.commit()
+
+
+class _OneOrNoneWrapper(_AsyncWrapper):
+    __slots__ = ()
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                q_res = await session.execute(sql_stmt)
+                # Keys are read before the result is consumed and closed
+                col_names = tuple(q_res.keys())
+                row = q_res.one_or_none()
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.sync_session.info)
+                ):
+                    await session.commit()
+                if row is None:
+                    return None
+                mc.tuples = 1
+                return self._row_builder(self._row_type, col_names)(row)
+            return None
+
+
+class _ScalarOrNoneWrapper(_AsyncWrapper):
+    __slots__ = ()
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                q_res = (await session.execute(sql_stmt)).scalar_one_or_none()
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.sync_session.info)
+                ):
+                    await session.commit()
+                if q_res is not None:
+                    mc.tuples = 1
+                return q_res
+            return None
+
+
+class _FetchScalarsWrapper(_AsyncWrapper):
+    __slots__ = ()
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                res = (await session.scalars(sql_stmt)).all()
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.sync_session.info)
+                ):
+                    await session.commit()
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _IterateScalarsWrapper(_AsyncWrapper):
+    __slots__ = ()
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> AsyncGenerator:
+        with collect_metrics(self._func):
+            sql_stmt = self._req_sql(args, kwargs)
+            if sql_stmt is None:
+                return
+            q_res = await session.scalars(sql_stmt)
+        for r in q_res:
+            yield r
+        if (
+            not self._no_commit
+            and not is_select_stmt(sql_stmt)
+            and not defer_commit(session.sync_session.info)
+        ):
+            await session.commit()
+
+
+class _ExecuteWrapper(_AsyncWrapper):
+    __slots__ = ()
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> None:
+        with collect_metrics(self._func):
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                await session.execute(sql_stmt)
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.sync_session.info)
+                ):
+                    await session.commit()
+
+
+class _ExecuteManyWrapper(WrapperBase):
+    __slots__ = ("_no_commit", "_sync_session")
+
+    def __init__(
+        self, func: Callable, no_commit: bool, sync_session: bool | str | None
+    ) -> None:
+        super().__init__(func)
+        self._no_commit = no_commit
+        self._sync_session = sync_session
+
+    async def __call__(self, session: AsyncSession, *args, **kwargs) -> None:
+        with collect_metrics(self._func):
+            if (
+                stmt_n_params := req_sql_n_params_many(
+                    self._func, args, kwargs, self._sync_session
+                )
+            ) is not None and stmt_n_params[1]:
+                sql_stmt = stmt_n_params[0]
+                await session.execute(sql_stmt, stmt_n_params[1])
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.sync_session.info)
+                ):
+                    await session.commit()
 
 
 def sql_fetch_all(
-    row_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    row_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stream_chunk_size: int | None = None,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make `.all()` queries.
@@ -33,6 +233,10 @@ def sql_fetch_all(
     :param row_type: type of expected result. Usually some dataclass or named tuple
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stream_chunk_size: if set, the result is read through a server-side
+    cursor by chunks of this size instead of being buffered by the driver at once.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -43,33 +247,18 @@ def sql_fetch_all(
     def decorator(
         func: Callable[F_Spec, Executable]
     ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, list[TR]]]:
-        class wrapper(WrapperBase):
-            async def __call__(
-                self, session: AsyncSession, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = await session.execute(sql_stmt)
-                        res: list[TR] = [
-                            row_type(**{n: v for n, v in r._asdict().items()})
-                            for r in q_res
-                        ]
-                        await _commit_if_needed(session, sql_stmt, no_commit)
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchAllWrapper(
+            func, row_type, no_commit, sync_session, stmt_cache_size, stream_chunk_size
+        )
 
     return decorator
 
 
 def sql_iterate(
-    row_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    row_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a query and iterate through results. Be careful with
@@ -79,6 +268,8 @@ def sql_iterate(
     :param row_type: type of expected result. Usually some dataclass or named tuple
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -89,32 +280,16 @@ def sql_iterate(
     def decorator(
         func: Callable[F_Spec, Executable]
     ) -> Callable[Concatenate[AsyncSession, F_Spec], AsyncGenerator[TR, None]]:
-        class wrapper(WrapperBase):
-            async def __call__(
-                self, session: AsyncSession, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> AsyncGenerator[TR, None]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = await session.execute(sql_stmt)
-                        is_first_row = True
-                        for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield row_type(**{n: v for n, v in r._asdict().items()})
-                        await _commit_if_needed(session, sql_stmt, no_commit)
-
-        return wrapper(func)
+        return _IterateWrapper(func, row_type, no_commit, sync_session, stmt_cache_size)
 
     return decorator
 
 
 def sql_one_or_none(
-    row_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    row_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make `.one_or_none()` queries.
@@ -122,6 +297,8 @@ def sql_one_or_none(
     :param row_type: type of expected result. Usually some dataclass or named tuple
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -132,31 +309,18 @@ def sql_one_or_none(
     def decorator(
         func: Callable[F_Spec, Executable],
     ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, TR | None]]:
-        class wrapper(WrapperBase):
-            async def __call__(
-                self, session: AsyncSession, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = (await session.execute(sql_stmt)).one_or_none()
-                        await _commit_if_needed(session, sql_stmt, no_commit)
-                        if q_res is None:
-                            return None
-                        mc.tuples = 1
-                        return row_type(**{n: v for n, v in q_res._asdict().items()})
-                    return None
-
-        return wrapper(func)
+        return _OneOrNoneWrapper(
+            func, row_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_scalar_or_none(
-    res_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    res_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a "scalar" SQL statement executor out of
@@ -166,6 +330,8 @@ def sql_scalar_or_none(
     `str`, `bool`, `datetime`, or whatever can be produced by scalar query.
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -176,30 +342,18 @@ def sql_scalar_or_none(
     def decorator(
         func: Callable[F_Spec, Executable],
     ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, TR | None]]:
-        class wrapper(WrapperBase):
-            async def __call__(
-                self, session: AsyncSession, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = (await session.execute(sql_stmt)).scalar_one_or_none()
-                        await _commit_if_needed(session, sql_stmt, no_commit)
-                        if q_res is not None:
-                            mc.tuples = 1
-                        return q_res
-                    return None
-
-        return wrapper(func)
+        return _ScalarOrNoneWrapper(
+            func, res_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_fetch_scalars(
-    res_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    res_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a "scalars" SQL statement executor out of
@@ -209,6 +363,8 @@ def sql_fetch_scalars(
     `str`, `bool`, `datetime`, or whatever can be produced by scalar query.
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -219,30 +375,18 @@ def sql_fetch_scalars(
     def decorator(
         func: Callable[F_Spec, Executable],
     ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, list[TR]]]:
-        class wrapper(WrapperBase):
-            async def __call__(
-                self, session: AsyncSession, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = (await session.execute(sql_stmt)).scalars()
-                        res = [el for el in q_res]
-                        await _commit_if_needed(session, sql_stmt, no_commit)
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchScalarsWrapper(
+            func, res_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_iterate_scalars(
-    res_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    res_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a query and iterate through scalar results. Be careful
@@ -253,6 +397,8 @@ def sql_iterate_scalars(
     `str`, `bool`, `datetime`, or whatever can be produced by scalar query.
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -263,26 +409,9 @@ def sql_iterate_scalars(
     def decorator(
         func: Callable[F_Spec, Executable]
     ) -> Callable[Concatenate[AsyncSession, F_Spec], AsyncGenerator[TR, None]]:
-        class wrapper(WrapperBase):
-            async def __call__(
-                self, session: AsyncSession, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> AsyncGenerator[TR, None]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = await session.scalars(sql_stmt)
-                        is_first_row = True
-                        for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield r
-                        await _commit_if_needed(session, sql_stmt, no_commit)
-
-        return wrapper(func)
+        return _IterateScalarsWrapper(
+            func, res_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
@@ -296,7 +425,9 @@ def sql_execute(
 
 @overload
 def sql_execute(
-    no_commit: bool = False, sync_session: bool | str | None = False
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ) -> Callable[
     [Callable[F_Spec, Coroutine[Any, Any, None]]],
     Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, None]],
@@ -308,12 +439,15 @@ def sql_execute(  # type: ignore
     func: Callable[F_Spec, Executable] | None = None,
     no_commit: bool = False,
     sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to execute a statement without responding a result.
 
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     IMPORTANT: decorated function must not be async, but after decoration it
     becomes async.
@@ -321,37 +455,91 @@ def sql_execute(  # type: ignore
     More info in the noorm.sqlalchemy_async docstring.
     """
 
+    def decorator(
+        func: Callable[F_Spec, Executable],
+    ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, None]]:
+        return _ExecuteWrapper(func, None, no_commit, sync_session, stmt_cache_size)
+
     if callable(func):
-        the_func = func
+        return decorator(func)
     else:
-        the_func = None
-
-    def decorator_wrapper():
-        def decorator(
-            func: Callable[F_Spec, Executable],
-        ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, None]]:
-            class wrapper(WrapperBase):
-                async def __call__(
-                    self,
-                    session: AsyncSession,
-                    *args: F_Spec.args,
-                    **kwargs: F_Spec.kwargs,
-                ) -> None:
-                    with MetricsCollector(self._func):
-                        if (
-                            sql_stmt := req_sql_n_params(
-                                self._func, args, kwargs, sync_session
-                            )
-                        ) is not None:
-                            await session.execute(sql_stmt)
-                            await _commit_if_needed(session, sql_stmt, no_commit)
-
-            return wrapper(func)
-
         return decorator
 
-    wrap_decorator = decorator_wrapper()
+
+@overload
+def sql_execute_many(
+    func: Callable[F_Spec, tuple[Executable, list[dict]]]
+) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, None]]:
+    pass  # pragma: no cover
+
+
+@overload
+def sql_execute_many(
+    no_commit: bool = False, sync_session: bool | str | None = False
+) -> Callable[
+    [Callable[F_Spec, tuple[Executable, list[dict]]]],
+    Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, None]],
+]:
+    pass  # pragma: no cover
+
+
+def sql_execute_many(  # type: ignore
+    func: Callable[F_Spec, tuple[Executable, list[dict]]] | None = None,
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+):
+    """
+    Use this decorator to execute a statement once for each set of parameters in
+    a single `session.execute` call ("executemany"). The decorated function returns
+    a tuple of the statement and a list of parameter dicts. Nothing is executed if
+    the list is empty.
+
+    The parameter sets are passed to the DBAPI `executemany`, so for UPDATE and
+    DELETE use `sa.bindparam` placeholders in the WHERE clause of a Core statement
+    (e.g. on `User.__table__`). ORM bulk UPDATE by primary key is not available in
+    SQLAlchemy 1.4.
+
+    :param no_commit: set to False to prevent commit after the DML execution.
+    :param sync_session: execution option `synchronize_session`. Default False.
+
+    IMPORTANT: decorated function must not be async, but after decoration it
+    becomes async.
+
+    More info in the noorm.sqlalchemy_async docstring.
+    """
+
+    def decorator(
+        func: Callable[F_Spec, tuple[Executable, list[dict]]],
+    ) -> Callable[Concatenate[AsyncSession, F_Spec], Coroutine[Any, Any, None]]:
+        return _ExecuteManyWrapper(func, no_commit, sync_session)
+
     if callable(func):
-        return wrap_decorator(the_func)
+        return decorator(func)
     else:
-        return wrap_decorator
+        return decorator
+
+
+@asynccontextmanager
+async def deferred_commit(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Use this context manager to commit once after a series of data manipulations
+    instead of committing after each of them:
+    ```
+    async with nm.deferred_commit(session):
+        await ins_user(session, "John")
+        await ins_user(session, "Jane")
+    # Commit is done here
+    ```
+    Nothing is committed if the block raises an exception. Nested blocks commit
+    with the outermost one.
+    """
+    if not start_deferred_commit(session.sync_session.info):
+        yield session
+        return
+    try:
+        yield session
+    except BaseException:
+        finish_deferred_commit(session.sync_session.info)
+        raise
+    if finish_deferred_commit(session.sync_session.info):
+        await session.commit()
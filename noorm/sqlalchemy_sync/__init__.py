@@ -11,6 +11,8 @@ Decorators:
 - `sql_fetch_scalars(res_type: type, no_commit: bool, sync_session: bool | str | None)`
   to fetch a list of scalars
 - `sql_execute(no_commit: bool, sync_session: bool | str | None)` to execute a statement
+- `sql_execute_many(no_commit: bool, sync_session: bool | str | None)` to execute
+  a statement for a list of parameter sets at once
 - `sql_iterate(row_type: type, no_commit: bool, sync_session: bool | str | None)` and
   `sql_iterate_scalars(row_type: type, no_commit: bool, sync_session: bool | str | None)`
   to make a query and iterate through results, objects or scalars respectively.
@@ -28,12 +30,20 @@ Decorator parameters are:
   persistent object in a session, there is nothing to synchronise. If you really need
   different behavior, set this `sync_session` parameter to "fetch" or "evaluate", or
   pass None to turn off the execution option manipulation.
+- Statement cache size. Default None (no caching). If set, statements returned by
+  the decorated function are memoized by its arguments, so the function is not
+  called again for the same arguments. Use it only for functions whose statement
+  depends on nothing but the arguments.
+
+To commit once after several data manipulations, wrap them into
+`with deferred_commit(session): ...`.
 
 After decoration the decorated function receives an open Session as a first positional
 argument.
 
 Decorated function should return an executable statement (select, insert, update,
-delete).
+delete). For `sql_execute_many` it returns a tuple of a statement and a list of
+parameter dicts.
 
 Examples:
 ```
@@ -59,12 +69,30 @@ def get_one_user(id_: int):
 def ins_user(username: str | None = None, email: str | None = None):
     return sa.insert(User).values(username=username, email=email)
 
+# Insert many records at once
+@nm.sql_execute_many
+def ins_users(users: list[tuple[str, str]]):
+    return sa.insert(User), [{"username": u, "email": e} for u, e in users]
+
+# Update many records at once. Use bindparam placeholders with names that differ
+# from the column names.
+@nm.sql_execute_many
+def rename_users(names: dict[int, str]):
+    users = User.__table__
+    stmt = (
+        sa.update(users)
+        .where(users.c.id == sa.bindparam("b_id"))
+        .values(username=sa.bindparam("b_username"))
+    )
+    return stmt, [{"b_id": k, "b_username": v} for k, v in names.items()]
+
 # Usage:
     for user in get_all_users(session):
         print(user)
     print(f"User with id=1: {get_one_user(session, 1)}")
 
     ins_user(session, "Jane", "jane@example.com") # Commit is done automatically
+    ins_users(session, [("John", "john@example.com"), ("Jim", "jim@example.com")])
 ```
 """  # noqa: E501
 
@@ -76,6 +104,8 @@ from ._sqlalchemy_sync import (
     sql_fetch_scalars,
     sql_iterate_scalars,
     sql_execute,
+    sql_execute_many,
+    deferred_commit,
 )
 from noorm._common import CancelExecException
 
@@ -87,5 +117,7 @@ __all__ = [
     "sql_fetch_scalars",
     "sql_iterate_scalars",
     "sql_execute",
+    "sql_execute_many",
+    "deferred_commit",
     "CancelExecException",
 ]
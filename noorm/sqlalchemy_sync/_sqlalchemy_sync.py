@@ -2,28 +2,211 @@
 NoORM (Not Only ORM) helpers for synchronous sqlalchemy
 """
 
-from typing import Type, Callable, Generator, ParamSpec, TypeVar, overload, Concatenate
+from typing import Type, Callable, Generator, ParamSpec, TypeVar, Any, overload
+from typing import Concatenate, Iterator
+from contextlib import contextmanager
 
 from sqlalchemy.sql import Executable
-from sqlalchemy.sql.selectable import GenerativeSelect
 from sqlalchemy.orm import Session as OrmSession, scoped_session
 
 from .._common import WrapperBase
-from .._sqlalchemy_common import req_sql_n_params
-from ..registry import MetricsCollector
+from .._sqlalchemy_common import stmt_builder, is_select_stmt, defer_commit
+from .._sqlalchemy_common import req_sql_n_params_many
+from .._sqlalchemy_common import start_deferred_commit, finish_deferred_commit
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 TR = TypeVar("TR")
 Session = OrmSession | scoped_session
 
 
-def _commit_if_needed(session: Session, sql_stmt: Executable, no_commit: bool):
-    if not isinstance(sql_stmt, GenerativeSelect) and not no_commit:
-        session.commit()
+class _SyncWrapper(WrapperBase):
+    """Base of the sync wrappers. Configuration is stored once per decoration."""
+
+    __slots__ = ("_row_type", "_no_commit", "_req_sql")
+
+    def __init__(
+        self,
+        func: Callable,
+        row_type: type | None,
+        no_commit: bool,
+        sync_session: bool | str | None,
+        stmt_cache_size: int | None,
+    ) -> None:
+        super().__init__(func)
+        self._row_type = row_type
+        self._no_commit = no_commit
+        self._req_sql = stmt_builder(func, sync_session, stmt_cache_size)
+
+
+class _FetchAllWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                q_res = session.execute(sql_stmt)
+                build = self._row_builder(self._row_type, tuple(q_res.keys()))
+                res = list(map(build, q_res))
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.info)
+                ):
+                    session.commit()
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _IterateWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> Generator:
+        # Metrics cover the statement execution only, so they are complete before
+        # the first row is yielded.
+        with collect_metrics(self._func):
+            sql_stmt = self._req_sql(args, kwargs)
+            if sql_stmt is None:
+                return
+            q_res = session.execute(sql_stmt)
+            build = self._row_builder(self._row_type, tuple(q_res.keys()))
+        yield from map(build, q_res)
+        if (
+            not self._no_commit
+            and not is_select_stmt(sql_stmt)
+            and not defer_commit(session.info)
+        ):
+            session.commit()
+
+
+class _OneOrNoneWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                q_res = session.execute(sql_stmt)
+                # Keys are read before the result is consumed and closed
+                col_names = tuple(q_res.keys())
+                row = q_res.one_or_none()
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.info)
+                ):
+                    session.commit()
+                if row is None:
+                    return None
+                mc.tuples = 1
+                return self._row_builder(self._row_type, col_names)(row)
+            return None
+
+
+class _ScalarOrNoneWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                q_res = session.execute(sql_stmt).scalar_one_or_none()
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.info)
+                ):
+                    session.commit()
+                if q_res is not None:
+                    mc.tuples = 1
+                return q_res
+            return None
+
+
+class _FetchScalarsWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                res = session.scalars(sql_stmt).all()
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.info)
+                ):
+                    session.commit()
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _IterateScalarsWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> Generator:
+        # Metrics cover the statement execution only, so they are complete before
+        # the first row is yielded.
+        with collect_metrics(self._func):
+            sql_stmt = self._req_sql(args, kwargs)
+            if sql_stmt is None:
+                return
+            q_res = session.scalars(sql_stmt)
+        yield from q_res
+        if (
+            not self._no_commit
+            and not is_select_stmt(sql_stmt)
+            and not defer_commit(session.info)
+        ):
+            session.commit()
+
+
+class _ExecuteWrapper(_SyncWrapper):
+    __slots__ = ()
+
+    def __call__(self, session: Session, *args, **kwargs) -> None:
+        with collect_metrics(self._func):
+            if (sql_stmt := self._req_sql(args, kwargs)) is not None:
+                session.execute(sql_stmt)
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.info)
+                ):
+                    session.commit()
+
+
+class _ExecuteManyWrapper(WrapperBase):
+    __slots__ = ("_no_commit", "_sync_session")
+
+    def __init__(
+        self, func: Callable, no_commit: bool, sync_session: bool | str | None
+    ) -> None:
+        super().__init__(func)
+        self._no_commit = no_commit
+        self._sync_session = sync_session
+
+    def __call__(self, session: Session, *args, **kwargs) -> None:
+        with collect_metrics(self._func):
+            if (
+                stmt_n_params := req_sql_n_params_many(
+                    self._func, args, kwargs, self._sync_session
+                )
+            ) is not None and stmt_n_params[1]:
+                sql_stmt = stmt_n_params[0]
+                session.execute(sql_stmt, stmt_n_params[1])
+                if (
+                    not self._no_commit
+                    and not is_select_stmt(sql_stmt)
+                    and not defer_commit(session.info)
+                ):
+                    session.commit()
 
 
 def sql_fetch_all(
-    row_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    row_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make `.all()` queries.
@@ -31,6 +214,8 @@ def sql_fetch_all(
     :param row_type: type of expected result. Usually some dataclass or named tuple
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
@@ -38,33 +223,18 @@ def sql_fetch_all(
     def decorator(
         func: Callable[F_Spec, Executable]
     ) -> Callable[Concatenate[Session, F_Spec], list[TR]]:
-        class wrapper(WrapperBase):
-            def __call__(
-                self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = session.execute(sql_stmt)
-                        res: list[TR] = [
-                            row_type(**{n: v for n, v in r._asdict().items()})
-                            for r in q_res
-                        ]
-                        _commit_if_needed(session, sql_stmt, no_commit)
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchAllWrapper(
+            func, row_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_iterate(
-    row_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    row_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a query and iterate through results. Be careful with
@@ -74,6 +244,8 @@ def sql_iterate(
     :param row_type: type of expected result. Usually some dataclass or named tuple
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
@@ -81,32 +253,16 @@ def sql_iterate(
     def decorator(
         func: Callable[F_Spec, Executable]
     ) -> Callable[Concatenate[Session, F_Spec], Generator[TR, None, None]]:
-        class wrapper(WrapperBase):
-            def __call__(
-                self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> Generator[TR, None, None]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = session.execute(sql_stmt)
-                        is_first_row = True
-                        for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield row_type(**{n: v for n, v in r._asdict().items()})
-                        _commit_if_needed(session, sql_stmt, no_commit)
-
-        return wrapper(func)
+        return _IterateWrapper(func, row_type, no_commit, sync_session, stmt_cache_size)
 
     return decorator
 
 
 def sql_one_or_none(
-    row_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    row_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make `.one_or_none()` queries.
@@ -114,6 +270,8 @@ def sql_one_or_none(
     :param row_type: type of expected result. Usually some dataclass or named tuple
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
@@ -121,31 +279,18 @@ def sql_one_or_none(
     def decorator(
         func: Callable[F_Spec, Executable],
     ) -> Callable[Concatenate[Session, F_Spec], TR | None]:
-        class wrapper(WrapperBase):
-            def __call__(
-                self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = session.execute(sql_stmt).one_or_none()
-                        _commit_if_needed(session, sql_stmt, no_commit)
-                        if q_res is None:
-                            return None
-                        mc.tuples = 1
-                        return row_type(**{n: v for n, v in q_res._asdict().items()})
-                    return None
-
-        return wrapper(func)
+        return _OneOrNoneWrapper(
+            func, row_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_scalar_or_none(
-    res_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    res_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a "scalar" SQL statement executor out of
@@ -155,6 +300,8 @@ def sql_scalar_or_none(
     `str`, `bool`, `datetime`, or whatever can be produced by scalar query.
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
@@ -162,30 +309,18 @@ def sql_scalar_or_none(
     def decorator(
         func: Callable[F_Spec, Executable],
     ) -> Callable[Concatenate[Session, F_Spec], TR | None]:
-        class wrapper(WrapperBase):
-            def __call__(
-                self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = session.execute(sql_stmt).scalar_one_or_none()
-                        _commit_if_needed(session, sql_stmt, no_commit)
-                        if q_res is not None:
-                            mc.tuples = 1
-                        return q_res
-                    return None
-
-        return wrapper(func)
+        return _ScalarOrNoneWrapper(
+            func, res_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_fetch_scalars(
-    res_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    res_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a "scalars" SQL statement executor out of
@@ -195,6 +330,8 @@ def sql_fetch_scalars(
     `str`, `bool`, `datetime`, or whatever can be produced by scalar query.
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
@@ -202,30 +339,18 @@ def sql_fetch_scalars(
     def decorator(
         func: Callable[F_Spec, Executable],
     ) -> Callable[Concatenate[Session, F_Spec], list[TR]]:
-        class wrapper(WrapperBase):
-            def __call__(
-                self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = session.execute(sql_stmt).scalars()
-                        res = [el for el in q_res]
-                        _commit_if_needed(session, sql_stmt, no_commit)
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchScalarsWrapper(
+            func, res_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
 
 def sql_iterate_scalars(
-    res_type: Type[TR], no_commit: bool = False, sync_session: bool | str | None = False
+    res_type: Type[TR],
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to make a query and iterate through scalar results. Be careful
@@ -236,6 +361,8 @@ def sql_iterate_scalars(
     `str`, `bool`, `datetime`, or whatever can be produced by scalar query.
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
@@ -243,26 +370,9 @@ def sql_iterate_scalars(
     def decorator(
         func: Callable[F_Spec, Executable]
     ) -> Callable[Concatenate[Session, F_Spec], Generator[TR, None, None]]:
-        class wrapper(WrapperBase):
-            def __call__(
-                self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-            ) -> Generator[TR, None, None]:
-                with MetricsCollector(self._func) as mc:
-                    if (
-                        sql_stmt := req_sql_n_params(
-                            self._func, args, kwargs, sync_session
-                        )
-                    ) is not None:
-                        q_res = session.execute(sql_stmt).scalars()
-                        is_first_row = True
-                        for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield r
-                        _commit_if_needed(session, sql_stmt, no_commit)
-
-        return wrapper(func)
+        return _IterateScalarsWrapper(
+            func, res_type, no_commit, sync_session, stmt_cache_size
+        )
 
     return decorator
 
@@ -276,7 +386,9 @@ def sql_execute(
 
 @overload
 def sql_execute(
-    no_commit: bool = False, sync_session: bool | str | None = False
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ) -> Callable[[Callable[F_Spec, None]], Callable[Concatenate[Session, F_Spec], None]]:
     pass  # pragma: no cover
 
@@ -285,44 +397,101 @@ def sql_execute(  # type: ignore
     func: Callable[F_Spec, Executable] | None = None,
     no_commit: bool = False,
     sync_session: bool | str | None = False,
+    stmt_cache_size: int | None = None,
 ):
     """
     Use this decorator to execute a statement without responding a result.
 
     :param no_commit: set to False to prevent commit after the DML execution.
     :param sync_session: execution option `synchronize_session`. Default False.
+    :param stmt_cache_size: if set, statements returned by the decorated function
+    are memoized by its arguments, up to this number of argument sets.
 
     More info in the noorm.sqlalchemy_sync docstring.
     """
 
+    def decorator(
+        func: Callable[F_Spec, Executable],
+    ) -> Callable[Concatenate[Session, F_Spec], None]:
+        return _ExecuteWrapper(func, None, no_commit, sync_session, stmt_cache_size)
+
     if callable(func):
-        the_func = func
+        return decorator(func)
     else:
-        the_func = None
-
-    def decorator_wrapper():
-        def decorator(
-            func: Callable[F_Spec, Executable],
-        ) -> Callable[Concatenate[Session, F_Spec], None]:
-            class wrapper(WrapperBase):
-                def __call__(
-                    self, session: Session, *args: F_Spec.args, **kwargs: F_Spec.kwargs
-                ) -> None:
-                    with MetricsCollector(self._func):
-                        if (
-                            sql_stmt := req_sql_n_params(
-                                self._func, args, kwargs, sync_session
-                            )
-                        ) is not None:
-                            session.execute(sql_stmt)
-                            _commit_if_needed(session, sql_stmt, no_commit)
-
-            return wrapper(func)
-
         return decorator
 
-    wrap_decorator = decorator_wrapper()
+
+@overload
+def sql_execute_many(
+    func: Callable[F_Spec, tuple[Executable, list[dict]]]
+) -> Callable[Concatenate[Session, F_Spec], None]:
+    pass  # pragma: no cover
+
+
+@overload
+def sql_execute_many(
+    no_commit: bool = False, sync_session: bool | str | None = False
+) -> Callable[
+    [Callable[F_Spec, tuple[Executable, list[dict]]]],
+    Callable[Concatenate[Session, F_Spec], None],
+]:
+    pass  # pragma: no cover
+
+
+def sql_execute_many(  # type: ignore
+    func: Callable[F_Spec, tuple[Executable, list[dict]]] | None = None,
+    no_commit: bool = False,
+    sync_session: bool | str | None = False,
+):
+    """
+    Use this decorator to execute a statement once for each set of parameters in
+    a single `session.execute` call ("executemany"). The decorated function returns
+    a tuple of the statement and a list of parameter dicts. Nothing is executed if
+    the list is empty.
+
+    The parameter sets are passed to the DBAPI `executemany`, so for UPDATE and
+    DELETE use `sa.bindparam` placeholders in the WHERE clause of a Core statement
+    (e.g. on `User.__table__`). ORM bulk UPDATE by primary key is not available in
+    SQLAlchemy 1.4.
+
+    :param no_commit: set to False to prevent commit after the DML execution.
+    :param sync_session: execution option `synchronize_session`. Default False.
+
+    More info in the noorm.sqlalchemy_sync docstring.
+    """
+
+    def decorator(
+        func: Callable[F_Spec, tuple[Executable, list[dict]]],
+    ) -> Callable[Concatenate[Session, F_Spec], None]:
+        return _ExecuteManyWrapper(func, no_commit, sync_session)
+
     if callable(func):
-        return wrap_decorator(the_func)
+        return decorator(func)
     else:
-        return wrap_decorator
+        return decorator
+
+
+@contextmanager
+def deferred_commit(session: Session) -> Iterator[Session]:
+    """
+    Use this context manager to commit once after a series of data manipulations
+    instead of committing after each of them:
+    ```
+    with nm.deferred_commit(session):
+        ins_user(session, "John")
+        ins_user(session, "Jane")
+    # Commit is done here
+    ```
+    Nothing is committed if the block raises an exception. Nested blocks commit
+    with the outermost one.
+    """
+    if not start_deferred_commit(session.info):
+        yield session
+        return
+    try:
+        yield session
+    except BaseException:
+        finish_deferred_commit(session.info)
+        raise
+    if finish_deferred_commit(session.info):
+        session.commit()
@@ -3,6 +3,8 @@ NoORM adapter for synchronous access to SQLite via Standard Python library.
 
 Decorators:
 - `sql_fetch_all(row_type: type, sql: str)` to fetch records as a list
+- `sql_fetch_all_many(row_type: type, sql: str)` to fetch records for several sets
+  of parameters as one list
 - `sql_one_or_none(res_type: type, sql: str)` to fetch one record
 - `sql_scalar_or_none(res_type: type, sql: str)` to fetch a scalar
 - `sql_fetch_scalars(res_type: type, sql: str)` to fetch a list of scalars
@@ -40,6 +42,10 @@ Decorated function should return:
 - `nm.PARAMS_APPLY_POSITIONAL` or `nm.PARAMS_APPLY_NAMED` in case you want to simply
   pass function parameters to the query as accordingly positional or named parameters.
 
+A function decorated with `sql_fetch_all_many` returns a collection of `nm.params`,
+`nm.query_only`, or `nm.query_and_params` results instead. Each of them is executed,
+and the rows of all of them are returned together.
+
 SQLite-specific features:
 1. You can use `date`, `datetime`, `bool`, `Decimal` fields in query result dataclasses.
    Conversion will be done automatically.
@@ -90,6 +96,14 @@ def get_num_users(search: str):
 def get_several_users(ids: list[int]):
     return nm.PARAMS_APPLY_NAMED
 
+# Fetch users by several patterns
+@nm.sql_fetch_all_many(
+    namedtuple("DbUsersResult", "id, username, email"),
+    "select rowid as id, username, email from users where username like ?;",
+)
+def get_users_by_patterns(patterns: list[str]):
+    return [nm.params(p) for p in patterns]
+
 # Insert a new record
 @nm.sql_execute("insert into users(username, email) values(?, ?)")
 def ins_user(username: str | None = None, email: str | None = None):
@@ -110,6 +124,7 @@ with sqlite3.connect("test.sqlite") as conn:  # "test.sqlite" is a DB file name
 
 from ._sqlite3 import (
     sql_fetch_all,
+    sql_fetch_all_many,
     sql_iterate,
     sql_one_or_none,
     sql_scalar_or_none,
@@ -125,6 +140,7 @@ from noorm._common import PARAMS_APPLY_POSITIONAL, PARAMS_APPLY_NAMED
 
 __all__ = [
     "sql_fetch_all",
+    "sql_fetch_all_many",
     "sql_iterate",
     "sql_one_or_none",
     "sql_scalar_or_none",
@@ -1,14 +1,17 @@
 from typing import Type, Callable, Generator, ParamSpec, TypeVar, Concatenate, overload
+from typing import Any, Iterable
+from contextvars import ContextVar, Token
 import sqlite3
 
-from .._common import WrapperBase, ParamsAutoEnum
+from .._common import WrapperBase, ParamsAutoEnum, _first_column
 from .._sqlite_common import (
-    make_decoder as _make_decoder,
     make_scalar_decoder as _make_scalar_decoder,
+    make_sqlite_row_builder,
     sqlite_sql_n_params,
+    sqlite_sql_n_params_many,
 )
 from .._db_api_2 import PrepareFuncResult
-from ..registry import MetricsCollector
+from ..registry import collect_metrics
 
 F_Spec = ParamSpec("F_Spec")
 F_Return = TypeVar("F_Return")
@@ -16,6 +19,166 @@ TR = TypeVar("TR")
 ConnectionOrCursor = sqlite3.Connection | sqlite3.Cursor
 
 
+class _SqliteWrapper(WrapperBase):
+    """Base of the sqlite3 wrappers. Configuration is stored once per decoration."""
+
+    __slots__ = ("_row_type", "_sql")
+
+    def __init__(self, func: Callable, row_type: type | None, sql: str | None) -> None:
+        super().__init__(func)
+        self._row_type = row_type
+        self._sql = sql
+
+
+class _ScalarWrapper(_SqliteWrapper):
+    __slots__ = ("_decoder",)
+
+    def __init__(self, func: Callable, res_type: type, sql: str | None) -> None:
+        super().__init__(func, res_type, sql)
+        self._decoder = _make_scalar_decoder(res_type)
+
+
+class _FetchAllWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = conn.execute(*sql_and_params)
+                build = self._row_builder(
+                    self._row_type,
+                    tuple(map(_first_column, q_res.description)),
+                    make_sqlite_row_builder,
+                )
+                res = list(map(build, q_res))
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _FetchAllManyWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            res: list = []
+            if sqls_and_params := sqlite_sql_n_params_many(
+                self._func, args, kwargs, self._sql
+            ):
+                # One cursor for all the statements
+                cur = conn.cursor() if isinstance(conn, sqlite3.Connection) else conn
+                for sql_and_params in sqls_and_params:
+                    q_res = cur.execute(*sql_and_params)
+                    build = self._row_builder(
+                        self._row_type,
+                        tuple(map(_first_column, q_res.description)),
+                        make_sqlite_row_builder,
+                    )
+                    res.extend(map(build, q_res))
+            mc.tuples = len(res)
+            return res
+
+
+class _IterateWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: sqlite3.Connection, *args, **kwargs) -> Generator:
+        # Metrics cover the statement execution only, so they are complete before
+        # the first row is yielded.
+        with collect_metrics(self._func):
+            sql_and_params = sqlite_sql_n_params(self._func, args, kwargs, self._sql)
+            if not sql_and_params:
+                return
+            cur = conn.cursor()
+            q_res = cur.execute(*sql_and_params)
+            build = self._row_builder(
+                self._row_type,
+                tuple(map(_first_column, q_res.description)),
+                make_sqlite_row_builder,
+            )
+        yield from map(build, q_res)
+
+
+class _OneOrNoneWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = conn.execute(*sql_and_params)
+                if (row := q_res.fetchone()) is not None:
+                    mc.tuples = 1
+                    return self._row_builder(
+                        self._row_type,
+                        tuple(map(_first_column, q_res.description)),
+                        make_sqlite_row_builder,
+                    )(row)
+            return None
+
+
+class _ScalarOrNoneWrapper(_ScalarWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> Any:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = conn.execute(*sql_and_params)
+                if (row := q_res.fetchone()) is not None:
+                    mc.tuples = 1
+                    decoder = self._decoder
+                    return row[0] if decoder is None else decoder(row[0])
+            return None
+
+
+class _FetchScalarsWrapper(_ScalarWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> list:
+        with collect_metrics(self._func) as mc:
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                q_res = conn.execute(*sql_and_params)
+                values = map(_first_column, q_res)
+                decoder = self._decoder
+                res = list(values if decoder is None else map(decoder, values))
+                mc.tuples = len(res)
+                return res
+            return []
+
+
+class _IterateScalarsWrapper(_ScalarWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: sqlite3.Connection, *args, **kwargs) -> Generator:
+        with collect_metrics(self._func):
+            sql_and_params = sqlite_sql_n_params(self._func, args, kwargs, self._sql)
+            if not sql_and_params:
+                return
+            cur = conn.cursor()
+            q_res = cur.execute(*sql_and_params)
+        values = map(_first_column, q_res)
+        decoder = self._decoder
+        yield from values if decoder is None else map(decoder, values)
+
+
+class _ExecuteWrapper(_SqliteWrapper):
+    __slots__ = ()
+
+    def __call__(self, conn: ConnectionOrCursor, *args, **kwargs) -> None:
+        with collect_metrics(self._func):
+            if sql_and_params := sqlite_sql_n_params(
+                self._func, args, kwargs, self._sql
+            ):
+                conn.execute(*sql_and_params)
+
+
 def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
     """
     Use this decorator to make a "fetch all" SQL statement executor out of
@@ -31,30 +194,29 @@ def sql_fetch_all(row_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], list[TR]]:
-        decoder = _make_decoder(row_type)
-
-        class wrapper(WrapperBase):
-            def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = conn.execute(*sql_and_params)
-                        col_names = tuple(el[0] for el in q_res.description)
-                        res: list[TR] = [
-                            row_type(**decoder({n: v for n, v in zip(col_names, r)}))
-                            for r in q_res
-                        ]
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchAllWrapper(func, row_type, sql)
+
+    return decorator
+
+
+def sql_fetch_all_many(row_type: Type[TR], sql: str | None = None):
+    """
+    Use this decorator to run a query with several parameter sets and fetch all the
+    results as one list. The decorated function returns a collection (e.g. a list)
+    of `nm.params`, `nm.query_and_params`, or `nm.query_only` results. The statements
+    are executed one by one on the same cursor.
+
+    :param row_type: type of expected result. Usually some dataclass or named tuple
+    :param sql: SQL statement to execute. If None, the SQL statement must be provided
+    by decorated function.
+
+    More info in the noorm.sqlite3 docstring.
+    """
+
+    def decorator(
+        func: Callable[F_Spec, Iterable[PrepareFuncResult]]
+    ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], list[TR]]:
+        return _FetchAllManyWrapper(func, row_type, sql)
 
     return decorator
 
@@ -75,32 +237,7 @@ def sql_iterate(row_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[sqlite3.Connection, F_Spec], Generator[TR, None, None]]:
-        decoder = _make_decoder(row_type)
-
-        class wrapper(WrapperBase):
-            def __call__(
-                self,
-                conn: sqlite3.Connection,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> Generator[TR, None, None]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        cur = conn.cursor()
-                        q_res = cur.execute(*sql_and_params)
-                        col_names = tuple(el[0] for el in q_res.description)
-                        is_first_row = True
-                        for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield row_type(
-                                **decoder({n: v for n, v in zip(col_names, r)})
-                            )
-
-        return wrapper(func)
+        return _IterateWrapper(func, row_type, sql)
 
     return decorator
 
@@ -120,29 +257,7 @@ def sql_one_or_none(row_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], TR | None]:
-        decoder = _make_decoder(row_type)
-
-        class wrapper(WrapperBase):
-            def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = conn.execute(*sql_and_params)
-                        col_names = tuple(el[0] for el in q_res.description)
-                        for row in q_res:
-                            mc.tuples = 1
-                            return row_type(
-                                **decoder({n: v for n, v in zip(col_names, row)})
-                            )
-                    return None
-
-        return wrapper(func)
+        return _OneOrNoneWrapper(func, row_type, sql)
 
     return decorator
 
@@ -164,26 +279,7 @@ def sql_scalar_or_none(res_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], TR | None]:
-        decoder = _make_scalar_decoder(res_type)
-
-        class wrapper(WrapperBase):
-            def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> TR | None:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = conn.execute(*sql_and_params)
-                        for row in q_res:
-                            mc.tuples = 1
-                            return decoder(row[0])
-                    return None
-
-        return wrapper(func)
+        return _ScalarOrNoneWrapper(func, res_type, sql)
 
     return decorator
 
@@ -205,26 +301,7 @@ def sql_fetch_scalars(res_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], list[TR]]:
-        decoder = _make_scalar_decoder(res_type)
-
-        class wrapper(WrapperBase):
-            def __call__(
-                self,
-                conn: ConnectionOrCursor,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> list[TR]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        q_res = conn.execute(*sql_and_params)
-                        res = [decoder(row[0]) for row in q_res]
-                        mc.tuples = len(res)
-                        return res
-                    return []
-
-        return wrapper(func)
+        return _FetchScalarsWrapper(func, res_type, sql)
 
     return decorator
 
@@ -247,29 +324,7 @@ def sql_iterate_scalars(res_type: Type[TR], sql: str | None = None):
     def decorator(
         func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
     ) -> Callable[Concatenate[sqlite3.Connection, F_Spec], Generator[TR, None, None]]:
-        decoder = _make_scalar_decoder(res_type)
-
-        class wrapper(WrapperBase):
-            def __call__(
-                self,
-                conn: sqlite3.Connection,
-                *args: F_Spec.args,
-                **kwargs: F_Spec.kwargs,
-            ) -> Generator[TR, None, None]:
-                with MetricsCollector(self._func) as mc:
-                    if sql_and_params := sqlite_sql_n_params(
-                        self._func, args, kwargs, sql
-                    ):
-                        cur = conn.cursor()
-                        q_res = cur.execute(*sql_and_params)
-                        is_first_row = True
-                        for r in q_res:
-                            if is_first_row:
-                                mc.finish(None)
-                                is_first_row = False
-                            yield decoder(r[0])
-
-        return wrapper(func)
+        return _IterateScalarsWrapper(func, res_type, sql)
 
     return decorator
 
@@ -305,38 +360,19 @@ def sql_execute(  # type: ignore
     """
 
     if callable(sql):
-        the_func = sql
-        the_sql = None
-    else:
-        the_func = None
-        the_sql = sql
-
-    def decorator_wrapper(sql: str | None):
-        def decorator(
-            func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
-        ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], None]:
-            class wrapper(WrapperBase):
-                def __call__(
-                    self,
-                    conn: ConnectionOrCursor,
-                    *args: F_Spec.args,
-                    **kwargs: F_Spec.kwargs,
-                ) -> None:
-                    with MetricsCollector(self._func):
-                        if sql_and_params := sqlite_sql_n_params(
-                            self._func, args, kwargs, sql
-                        ):
-                            conn.execute(*sql_and_params)
-
-            return wrapper(func)
-
-        return decorator
-
-    wrap_decorator = decorator_wrapper(the_sql)
-    if callable(sql):
-        return wrap_decorator(the_func)
-    else:
-        return wrap_decorator
+        return _ExecuteWrapper(sql, None, None)
+
+    def decorator(
+        func: Callable[F_Spec, PrepareFuncResult | ParamsAutoEnum | None]
+    ) -> Callable[Concatenate[ConnectionOrCursor, F_Spec], None]:
+        return _ExecuteWrapper(func, None, sql)
+
+    return decorator
+
+
+_default_db: ContextVar[sqlite3.Connection | None] = ContextVar(
+    "noorm_sqlite3_default_db", default=None
+)
 
 
 class set_default_db:
@@ -344,23 +380,23 @@ class set_default_db:
     Use `nm.set_default_db(your_connection)` as a function or as a context manager
     to set your "default" DB connection before first usage of function decorated with
     the `@nm.default_db` decorator.
-    """
 
-    _conns: list[sqlite3.Connection | None] = []
+    The default is kept in a context variable, so it is seen only by the current
+    thread and by asyncio tasks created after it is set. Other threads do not see
+    it: call `nm.set_default_db` in each thread, or run the thread's work in a copy
+    of the context (`contextvars.copy_context().run`). The context manager keeps the
+    default until the end of the block, the function form until the end of the
+    enclosing block, if any.
+    """
 
     def __init__(self, conn: sqlite3.Connection) -> None:
-        if not self._conns:
-            self._conns.append(None)
-        self.prev = self._conns[-1]
-        self._conns[-1] = conn
+        self.token: Token = _default_db.set(conn)
 
     def __enter__(self) -> None:
-        curr = self._conns[-1]
-        self._conns[-1] = self.prev
-        self._conns.append(curr)
+        pass
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self._conns.pop()
+        _default_db.reset(self.token)
 
 
 def default_db(
@@ -395,6 +431,8 @@ def default_db(
     nm.set_default_db(conn)
     users_count = get_users_count()
     ```
+    The default connection is per thread (or asyncio task). A connection set in the
+    main thread is not seen by other threads.
     The `nm.set_default_db` context can be nested:
     ```
     conn1 = sqlite3.connect("my_db_1.sqlite")
@@ -408,7 +446,7 @@ def default_db(
     """
 
     def wrapper(*args: F_Spec.args, **kwargs: F_Spec.kwargs) -> F_Return:
-        if not set_default_db._conns or (conn := set_default_db._conns[-1]) is None:
+        if (conn := _default_db.get()) is None:
             raise RuntimeError(
                 "default_db is not set. Use nm.set_default_db() to set default DB "
                 "connection before the first usage of function decorated "
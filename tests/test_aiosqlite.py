@@ -141,6 +141,39 @@ async def test_fetch_find(tst_conn: aiosqlite.Connection):
     assert got == []
 
 
+# MARK: sql_fetch_all_many
+
+
+UserIdName = namedtuple("UserIdName", "id,username")
+
+
+@nm.sql_fetch_all_many(
+    UserIdName, "select rowid as id, username from users where username = ?"
+)
+def get_users_by_names(names: list[str] | None):
+    if names is None:
+        raise nm.CancelExecException
+    return [nm.params(name) for name in names]
+
+
+async def test_fetch_all_many(tst_conn: aiosqlite.Connection, monkeypatch):
+    closed_cursors = []
+    close_cursor = aiosqlite.Cursor.close
+
+    async def close_and_count(cur: aiosqlite.Cursor):
+        closed_cursors.append(cur)
+        await close_cursor(cur)
+
+    monkeypatch.setattr(aiosqlite.Cursor, "close", close_and_count)
+    got = await get_users_by_names(tst_conn, ["Jane", "Nobody", "John"])
+    assert got == [UserIdName(2, "Jane"), UserIdName(1, "John")]
+    assert len(closed_cursors) == 1  # its own cursor is closed
+    cur = await tst_conn.cursor()
+    assert await get_users_by_names(cur, ["John"]) == [UserIdName(1, "John")]
+    assert len(closed_cursors) == 1  # a cursor that is passed in stays open
+    assert await get_users_by_names(tst_conn, None) == []
+
+
 # MARK: sql_iterate
 
 
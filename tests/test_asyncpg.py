@@ -1,4 +1,5 @@
 from collections import namedtuple
+from collections.abc import Mapping
 from dataclasses import dataclass
 import json
 from unittest.mock import AsyncMock, call
@@ -165,6 +166,46 @@ async def test_one_or_none_cancel(tst_conn: AsyncMock):
     assert tst_conn.fetchrow.call_count == 0
 
 
+class FakeRecord(Mapping):
+    """Like asyncpg.Record: a mapping by column name, also indexed by position"""
+
+    def __init__(self, items: dict) -> None:
+        self._items = items
+        self._values = tuple(items.values())
+
+    def __getitem__(self, key):
+        return self._values[key] if isinstance(key, int) else self._items[key]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+@nm.sql_fetch_all(
+    namedtuple("AllUsersResult", "id,username"),
+    '[{"username": "John", "id": 1}, {"username": "Jane", "id": 2}]',
+)
+def get_reordered_users():
+    pass
+
+
+async def test_records_to_row_type(tst_conn: AsyncMock):
+    async def fetch_records(res_json, *params):
+        return [FakeRecord(r) for r in json.loads(res_json)]
+
+    async def fetchrow_record(res_json, *params):
+        return FakeRecord(json.loads(res_json))
+
+    tst_conn.fetch.side_effect = fetch_records
+    tst_conn.fetchrow.side_effect = fetchrow_record
+    got = await get_reordered_users(tst_conn)
+    assert got == [(1, "John"), (2, "Jane")]
+    assert got[1].username == "Jane"
+    assert await get_user_by_id(tst_conn, 1) == UData(id=1, username="John")
+
+
 # MARK: sql_scalar_or_none
 
 
@@ -128,6 +128,83 @@ def test_fetch_all_wrong(tst_conn: Mock):
         _ = get_all_users_wrong3(tst_conn, 1)
 
 
+get_reordered_users_fake_sql = '[{"username": "John", "id": 1}]'
+
+
+@dataclass
+class UDataPost:
+    id: int
+    username: str
+
+    def __post_init__(self):
+        self.username = self.username.upper()
+
+
+@nm.sql_fetch_all(namedtuple("AllUsersResult", "id,username"))
+def get_reordered_users_namedtuple():
+    return nm.query_only(get_reordered_users_fake_sql)
+
+
+@nm.sql_fetch_all(UDataPost)
+def get_reordered_users_dataclass():
+    return nm.query_only(get_reordered_users_fake_sql)
+
+
+@nm.sql_fetch_all(dict)
+def get_reordered_users_dict():
+    return nm.query_only('[{"count(*)": 1, "class": 2}]')
+
+
+_exec_namespace: dict = {}
+exec(  # a custom __init__ that is not defined in a source file
+    "def __init__(self, id, username):\n"
+    "    self.id = id\n"
+    "    self.username = username.lower()\n",
+    _exec_namespace,
+)
+
+
+@dataclass
+class UDataInit:
+    id: int
+    username: str
+
+    __init__ = _exec_namespace["__init__"]
+
+
+@dataclass
+class UDataNew:
+    id: int
+    username: str
+
+    def __new__(cls, id: int, username: str):
+        obj = super().__new__(cls)
+        obj.created_by_new = True  # type: ignore
+        return obj
+
+
+@nm.sql_fetch_all(UDataInit)
+def get_reordered_users_custom_init():
+    return nm.query_only(get_reordered_users_fake_sql)
+
+
+@nm.sql_fetch_all(UDataNew)
+def get_reordered_users_custom_new():
+    return nm.query_only(get_reordered_users_fake_sql)
+
+
+def test_fetch_all_row_types(tst_conn: Mock):
+    got = get_reordered_users_namedtuple(tst_conn)
+    assert got == [(1, "John")]
+    assert got[0].username == "John"
+    assert get_reordered_users_dataclass(tst_conn) == [UDataPost(1, "john")]
+    assert get_reordered_users_dict(tst_conn) == [{"count(*)": 1, "class": 2}]
+    assert get_reordered_users_custom_init(tst_conn) == [UDataInit(1, "john")]
+    got_new = get_reordered_users_custom_new(tst_conn)
+    assert got_new == [UDataNew(1, "John")]
+    assert got_new[0].created_by_new  # type: ignore
+
+
 # MARK: sql_iterate
 
 
@@ -1,10 +1,14 @@
 from unittest.mock import Mock
 import multiprocessing as mp
 from queue import Empty as EmptyQException
+from types import SimpleNamespace
+from threading import Thread
+import socket
+import os
 
 import pytest
 
-from noorm.registry import get_registry
+from noorm.registry import get_registry, Registry, FuncCallEvent, Stat
 import noorm.sqlalchemy_sync as nm
 
 from subdir import some_module  # noqa: F401
@@ -38,6 +42,8 @@ def test_funcs():
     assert got_stat.fails == 1
     assert got_stat.tuples == 0
     assert got_stat.fails_by_error == {"ZeroDivisionError": 1}
+    assert registry.get_stat(func_name) == got_stat
+    assert registry.get_stat("no.such.func") == Stat()
 
     got_callback_calls = [
         (el.args[0].func_name, el.args[0].tuples, el.args[0].error)
@@ -49,6 +55,64 @@ def test_funcs():
     ]
 
 
+def test_background_listener():
+    # A private registry: its listeners must not stay on the global one
+    registry = Registry()
+    event_listener_callback = Mock()
+    registry.add_event_listener(event_listener_callback, background=True)
+    registry.add_event_listener(lambda x: 1 / 0, background=True)  # bad listener
+
+    registry.on_event(FuncCallEvent("some.func", 0.1, 0, None))
+    registry.on_event(FuncCallEvent("some.func", 0.1, 0, "ZeroDivisionError"))
+
+    assert registry.wait_background_listeners(timeout=5.0)
+    got_callback_calls = [
+        (el.args[0].func_name, el.args[0].tuples, el.args[0].error)
+        for el in event_listener_callback.call_args_list
+    ]
+    assert got_callback_calls == [
+        ("some.func", 0, None),
+        ("some.func", 0, "ZeroDivisionError"),
+    ]
+
+
+def test_collect_stat_switch():
+    registry = Registry()
+    assert registry.metrics_enabled
+    registry.collect_stat = False
+    assert not registry.metrics_enabled
+    registry.add_event_listener(Mock())
+    assert registry.metrics_enabled
+
+    registry.on_event(FuncCallEvent("some.func", 0.1, 1, None))
+    assert registry.stat_by_name == {}
+    registry.collect_stat = True
+    registry.on_event(FuncCallEvent("some.func", 0.1, 1, None))
+    assert registry.stat_by_name["some.func"].calls == 1
+
+
+def test_stat_by_name_is_live():
+    registry = Registry()
+    stat_by_name = registry.stat_by_name
+    event = FuncCallEvent("some.func", 0.1, 1, None)
+
+    def send_events():
+        for _ in range(1000):
+            registry.on_event(event)
+
+    threads = [Thread(target=send_events) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stat_by_name["some.func"].calls == 4000
+    assert registry.get_stat("some.func") == stat_by_name["some.func"]
+    registry.clear_stat()
+    assert stat_by_name == {}
+    registry.on_event(event)
+    assert stat_by_name["some.func"].calls == 1
+
+
 def sideprocess_worker(res_queue: mp.Queue):
     get_registry().init_multiprocess_registry()
     noop(None)
@@ -95,3 +159,32 @@ def test_multiprocessing(start_method: str):
     assert got_stat.fails_by_error == {"ZeroDivisionError": 1}
 
     registry.close_multiprocess_registry()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no unix sockets")
+def test_child_does_not_block(monkeypatch, tmp_path):
+    sock_path = str(tmp_path / "registry.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as main_socket:
+        main_socket.bind(sock_path)  # nobody reads it
+        monkeypatch.setenv("NOORM_REGISTRY_SOCKET", sock_path)
+        monkeypatch.setattr(
+            "noorm.registry.current_process", lambda: SimpleNamespace(name="Child")
+        )
+        registry = Registry()
+        for _ in range(5000):
+            registry.on_event(FuncCallEvent("some.func", 0.1, 1, None))
+        assert registry.mp_dropped_events > 0
+
+
+def test_long_tmpdir_falls_back_to_udp(monkeypatch, tmp_path):
+    long_dir = tmp_path / ("x" * 120)
+    long_dir.mkdir()
+    monkeypatch.setattr("tempfile.tempdir", str(long_dir))
+    registry = Registry()
+    registry.init_multiprocess_registry()
+    try:
+        assert "NOORM_REGISTRY_SOCKET" not in os.environ
+        assert os.environ["NOORM_REGISTRY_PORT"]
+        assert list(long_dir.iterdir()) == []
+    finally:
+        registry.close_multiprocess_registry()
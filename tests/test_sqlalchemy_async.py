@@ -1,5 +1,6 @@
 from typing import AsyncGenerator
 from collections import namedtuple
+from dataclasses import dataclass
 
 import pytest
 import sqlalchemy as sa
@@ -81,6 +82,39 @@ async def test_fetch_all_wrong(session: AsyncSession):
         _ = await get_all_users_wrong2(session, 1)
 
 
+@dataclass
+class UserData:
+    id: int
+    username: str
+
+
+@nm.sql_fetch_all(UserData)
+def get_all_users_dataclass():
+    return sa.select(User.username, User.id).order_by(User.id)
+
+
+@nm.sql_fetch_all(dict)
+def get_all_users_dict():
+    return sa.select(User.id, User.username.label("class")).order_by(User.id)
+
+
+async def test_fetch_all_row_types(session: AsyncSession):
+    got = await get_all_users_dataclass(session)
+    assert got == [UserData(1, "John"), UserData(2, "Jane")]
+    got = await get_all_users_dict(session)
+    assert got == [{"id": 1, "class": "John"}, {"id": 2, "class": "Jane"}]
+
+
+@nm.sql_fetch_all(UserData, stream_chunk_size=1)
+def get_all_users_streamed():
+    return sa.select(User.id, User.username).order_by(User.id)
+
+
+async def test_fetch_all_streamed(session: AsyncSession):
+    got = await get_all_users_streamed(session)
+    assert got == [UserData(1, "John"), UserData(2, "Jane")]
+
+
 # MARK: sql_iterate
 
 
@@ -133,6 +167,35 @@ async def test_get_user_info(session: AsyncSession):
     assert got is None
 
 
+@nm.sql_one_or_none(UserData)
+def get_user_data(user_id: int):
+    return sa.select(User.id, User.username).filter(User.id == user_id)
+
+
+async def test_get_user_data(session: AsyncSession):
+    got = await get_user_data(session, 2)
+    assert type(got) is UserData
+    assert got == UserData(2, "Jane")
+    assert await get_user_data(session, 3) is None
+
+
+get_user_by_name_calls = 0
+
+
+@nm.sql_one_or_none(UserData, stmt_cache_size=2)
+def get_user_by_name(username: str):
+    global get_user_by_name_calls
+    get_user_by_name_calls += 1
+    return sa.select(User.id, User.username).filter(User.username == username)
+
+
+async def test_stmt_cache(session: AsyncSession):
+    for _ in range(2):
+        assert await get_user_by_name(session, "John") == UserData(1, "John")
+        assert await get_user_by_name(session, username="Jane") == UserData(2, "Jane")
+    assert get_user_by_name_calls == 2
+
+
 # MARK: sql_scalar_or_none
 
 
@@ -247,3 +310,66 @@ async def test_delete_user(session: AsyncSession, no_commit: bool):
 
     await delete_all_users(session)
     assert (await get_users_count(session)) == 0
+
+
+async def test_deferred_commit(session: AsyncSession):
+    async with nm.deferred_commit(session):
+        await rename_user(session, 1, "Mr. John")
+        async with nm.deferred_commit(session):
+            await delete_user(session, 2)
+        await session.rollback()  # nothing is commited yet
+    assert (await get_user_name(session, 1)) == "John"
+    assert (await get_users_count(session)) == 2
+
+    async with nm.deferred_commit(session):
+        await rename_user(session, 1, "Mr. John")
+        await delete_user(session, 2)
+    await session.rollback()  # no effect because already commited
+    assert (await get_user_name(session, 1)) == "Mr. John"
+    assert (await get_users_count(session)) == 1
+
+    with pytest.raises(ZeroDivisionError):
+        async with nm.deferred_commit(session):
+            await delete_user(session, 1)
+            1 / 0
+    await session.rollback()
+    assert (await get_users_count(session)) == 1
+
+
+@nm.sql_fetch_scalars(int)
+def ins_user_returning_id(username: str):
+    return sa.insert(User).values(username=username).returning(User.id)
+
+
+async def test_fetch_commits_dml(session: AsyncSession):
+    got = await ins_user_returning_id(session, "Jim")
+    assert got == [3]
+    await session.rollback()  # no effect because already commited
+    assert (await get_users_count(session)) == 3
+
+
+@nm.sql_execute_many
+def ins_users(usernames: list[str]):
+    return sa.insert(User), [{"username": n} for n in usernames]
+
+
+@nm.sql_execute_many(no_commit=True)
+def rename_users_no_commit(names: dict[int, str]):
+    users = User.__table__
+    stmt = (
+        sa.update(users)
+        .where(users.c.id == sa.bindparam("b_id"))
+        .values(username=sa.bindparam("b_username"))
+    )
+    return stmt, [{"b_id": k, "b_username": v} for k, v in names.items()]
+
+
+async def test_execute_many(session: AsyncSession):
+    await ins_users(session, ["Jim", "Jack"])
+    await session.rollback()  # no effect because already commited
+    assert (await get_users_count(session)) == 4
+
+    await rename_users_no_commit(session, {1: "Mr. John", 2: "Mrs. Jane"})
+    assert (await get_user_name(session, 2)) == "Mrs. Jane"
+    await session.rollback()
+    assert (await get_user_name(session, 2)) == "Jane"
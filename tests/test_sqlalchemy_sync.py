@@ -1,5 +1,6 @@
 from typing import Generator
 from collections import namedtuple
+from dataclasses import dataclass
 
 import pytest
 import sqlalchemy as sa
@@ -84,6 +85,112 @@ def test_fetch_all_wrong(session: Session):
         _ = get_all_users_wrong2(session, 1)
 
 
+@dataclass
+class UserData:
+    id: int
+    username: str
+
+
+@nm.sql_fetch_all(UserData)
+def get_all_users_dataclass():
+    return sa.select(User.username, User.id).order_by(User.id)
+
+
+@nm.sql_fetch_all(namedtuple("AllUsersResult", "id,username"))
+def get_all_users_reordered():
+    return sa.select(User.username, User.id).order_by(User.id)
+
+
+@nm.sql_fetch_all(dict)
+def get_all_users_dict():
+    return sa.select(User.id, User.username.label("class")).order_by(User.id)
+
+
+@nm.sql_fetch_all(tuple)
+def get_all_users_tuple():
+    return sa.select(User.id, User.username).order_by(User.id)
+
+
+def test_fetch_all_row_types(session: Session):
+    got = get_all_users_dataclass(session)
+    assert got == [UserData(1, "John"), UserData(2, "Jane")]
+    got = get_all_users_reordered(session)
+    assert [(r.id, r.username) for r in got] == [(1, "John"), (2, "Jane")]
+    got = get_all_users_dict(session)
+    assert got == [{"id": 1, "class": "John"}, {"id": 2, "class": "Jane"}]
+    got = get_all_users_tuple(session)
+    assert got == [(1, "John"), (2, "Jane")]
+    assert type(got[0]) is tuple
+
+
+get_user_by_name_calls = 0
+
+
+@nm.sql_one_or_none(UserData, stmt_cache_size=2)
+def get_user_by_name(username: str | list):
+    global get_user_by_name_calls
+    get_user_by_name_calls += 1
+    if isinstance(username, list):
+        username = username[0]
+    return sa.select(User.id, User.username).filter(User.username == username)
+
+
+def test_stmt_cache(session: Session):
+    for _ in range(2):
+        assert get_user_by_name(session, "John") == UserData(1, "John")
+        assert get_user_by_name(session, username="Jane") == UserData(2, "Jane")
+    assert get_user_by_name_calls == 2
+    assert get_user_by_name(session, "Jane") == UserData(2, "Jane")
+    assert get_user_by_name_calls == 3
+    # Unhashable arguments are not cached
+    assert get_user_by_name(session, ["John"]) == UserData(1, "John")
+    assert get_user_by_name(session, ["John"]) == UserData(1, "John")
+    assert get_user_by_name_calls == 5
+
+
+get_username_by_id_calls = 0
+
+
+@nm.sql_scalar_or_none(str, stmt_cache_size=4)
+def get_username_by_id(id_: int | bool | None):
+    global get_username_by_id_calls
+    get_username_by_id_calls += 1
+    if id_ is None:
+        raise nm.CancelExecException
+    if isinstance(id_, bool):  # True == 1, but it is another statement
+        id_ = 2 if id_ else 1
+    return sa.select(User.username).filter(User.id == id_)
+
+
+def test_stmt_cache_keys(session: Session):
+    assert get_username_by_id(session, 1) == "John"
+    assert get_username_by_id(session, True) == "Jane"
+    assert get_username_by_id(session, 1) == "John"
+    assert get_username_by_id_calls == 2
+    # Cancelled calls are not cached
+    assert get_username_by_id(session, None) is None
+    assert get_username_by_id(session, None) is None
+    assert get_username_by_id_calls == 4
+
+
+get_all_user_ids_calls = 0
+
+
+@nm.sql_fetch_scalars(int, stmt_cache_size=1)
+def get_all_user_ids():
+    global get_all_user_ids_calls
+    get_all_user_ids_calls += 1
+    return sa.select(User.id).order_by(User.id)
+
+
+def test_stmt_cache_no_params(session: Session):
+    assert get_all_user_ids(session) == [1, 2]
+    assert get_all_user_ids(session) == [1, 2]
+    assert get_all_user_ids_calls == 1
+    with pytest.raises(TypeError):
+        get_all_user_ids(session, 1)
+
+
 # MARK: sql_iterate
 
 
@@ -136,6 +243,18 @@ def test_get_user_info(session: Session):
     assert got is None
 
 
+@nm.sql_one_or_none(UserData)
+def get_user_data(user_id: int):
+    return sa.select(User.id, User.username).filter(User.id == user_id)
+
+
+def test_get_user_data(session: Session):
+    got = get_user_data(session, 2)
+    assert type(got) is UserData
+    assert got == UserData(2, "Jane")
+    assert get_user_data(session, 3) is None
+
+
 # MARK: sql_scalar_or_none
 
 
@@ -246,3 +365,67 @@ def test_delete_user(session: Session, no_commit: bool):
 
     delete_all_users(session)
     assert get_users_count(session) == 0
+
+
+def test_deferred_commit(session: Session):
+    with nm.deferred_commit(session):
+        rename_user(session, 1, "Mr. John")
+        with nm.deferred_commit(session):
+            delete_user(session, 2)
+        session.rollback()  # nothing is commited yet
+    assert get_user_name(session, 1) == "John"
+    assert get_users_count(session) == 2
+
+    with nm.deferred_commit(session):
+        rename_user(session, 1, "Mr. John")
+        delete_user(session, 2)
+    session.rollback()  # no effect because already commited
+    assert get_user_name(session, 1) == "Mr. John"
+    assert get_users_count(session) == 1
+
+    with pytest.raises(ZeroDivisionError):
+        with nm.deferred_commit(session):
+            delete_user(session, 1)
+            1 / 0
+    session.rollback()
+    assert get_users_count(session) == 1
+
+
+@nm.sql_execute_many
+def ins_users(usernames: list[str]):
+    return sa.insert(User), [{"username": n} for n in usernames]
+
+
+@nm.sql_execute_many(no_commit=True)
+def rename_users_no_commit(names: dict[int, str]):
+    if not names:
+        raise nm.CancelExecException
+    users = User.__table__
+    stmt = (
+        sa.update(users)
+        .where(users.c.id == sa.bindparam("b_id"))
+        .values(username=sa.bindparam("b_username"))
+    )
+    return stmt, [{"b_id": k, "b_username": v} for k, v in names.items()]
+
+
+@nm.sql_execute_many
+def ins_users_wrong():
+    return sa.insert(User)
+
+
+def test_execute_many(session: Session):
+    ins_users(session, ["Jim", "Jack"])
+    ins_users(session, [])
+    session.rollback()  # no effect because already commited
+    assert get_users_count(session) == 4
+
+    rename_users_no_commit(session, {1: "Mr. John", 2: "Mrs. Jane"})
+    rename_users_no_commit(session, {})  # cancelled
+    ins_users(session, [])  # nothing to execute, so nothing is committed
+    assert get_user_name(session, 2) == "Mrs. Jane"
+    session.rollback()
+    assert get_user_name(session, 2) == "Jane"
+
+    with pytest.raises(TypeError):
+        ins_users_wrong(session)
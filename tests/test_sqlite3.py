@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from hashlib import sha1
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context
 
 import pytest
 import noorm.sqlite3 as nm
@@ -147,6 +149,16 @@ class UData:
     username: str
 
 
+@nm.sql_fetch_all(UData, "select rowid as id, username, email from users")
+def get_all_users_unknown_column():
+    pass
+
+
+def test_fetch_all_unknown_column(tst_conn: sqlite3.Connection):
+    with pytest.raises(KeyError):
+        get_all_users_unknown_column(tst_conn)
+
+
 @nm.sql_fetch_all(
     UData,
     """select rowid as id, username
@@ -180,6 +192,68 @@ def test_params_apply(tst_conn: sqlite3.Connection):
     ]
 
 
+# MARK: sql_fetch_all_many
+
+
+UserIdName = namedtuple("UserIdName", "id,username")
+
+
+@nm.sql_fetch_all_many(
+    UserIdName, "select rowid as id, username from users where username = ?"
+)
+def get_users_by_names(names: list[str] | None):
+    if names is None:
+        raise nm.CancelExecException
+    return [nm.params(name) for name in names]
+
+
+@nm.sql_fetch_all_many(UserIdName)
+def get_users_by_ids_and_names(ids: list[int], names: list[str]):
+    return [
+        nm.query_and_params(
+            "select rowid as id, username from users where rowid in (?)", ids
+        )
+    ] + [
+        nm.query_and_params(
+            "select rowid as id, username from users where username = :name",
+            name=name,
+        )
+        for name in names
+    ]
+
+
+@nm.sql_fetch_all_many(UserIdName, "select rowid as id, username from users")
+def get_users_many_wrong():
+    return [None]
+
+
+@nm.sql_fetch_all_many(
+    UserIdName, "select rowid as id, username from users where username = ?"
+)
+def get_users_by_names_cancelled(names: list[str | None]):
+    for name in names:
+        if name is None:
+            raise nm.CancelExecException
+        yield nm.params(name)
+
+
+def test_fetch_all_many(tst_conn: sqlite3.Connection):
+    got = get_users_by_names(tst_conn, ["Jane", "Nobody", "John"])
+    assert got == [UserIdName(2, "Jane"), UserIdName(1, "John")]
+    cur = tst_conn.cursor()
+    assert get_users_by_names(cur, ["John"]) == [UserIdName(1, "John")]
+    assert get_users_by_names(tst_conn, []) == []
+    assert get_users_by_names(tst_conn, None) == []
+
+    got = get_users_by_ids_and_names(tst_conn, [1, 2], ["Jane"])
+    assert got == [UserIdName(1, "John"), UserIdName(2, "Jane"), UserIdName(2, "Jane")]
+
+    with pytest.raises(TypeError):
+        _ = get_users_many_wrong(tst_conn)
+    # Cancelled in the middle of the list: no statement is executed
+    assert get_users_by_names_cancelled(tst_conn, ["John", None]) == []
+
+
 # MARK: sql_iterate
 
 
@@ -217,6 +291,24 @@ def test_one_or_none(tst_conn: sqlite3.Connection):
     assert user_info is None
 
 
+@nm.sql_one_or_none(dict, "select * from t")
+def get_t_row():
+    pass
+
+
+def test_same_sql_different_schema():
+    conn1 = sqlite3.connect(":memory:")
+    conn1.execute("create table t(x, y)")
+    conn1.execute("insert into t values (1, 2)")
+    conn2 = sqlite3.connect(":memory:")
+    conn2.execute("create table t(y, x)")
+    conn2.execute("insert into t values (2, 1)")
+    assert get_t_row(conn1) == {"x": 1, "y": 2}
+    assert get_t_row(conn2) == {"x": 1, "y": 2}
+    conn1.execute("alter table t rename column x to z")
+    assert get_t_row(conn1) == {"z": 1, "y": 2}
+
+
 CollParamsRes = namedtuple("CollParamsRes", "s1,i1,s2")
 
 
@@ -429,6 +521,57 @@ def test_def_db(tst_conn: sqlite3.Connection):
         a = get_count_def_db(2)
 
 
+def count_def_db_in_thread():
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(get_count_def_db, 2).exception()
+
+
+def test_def_db_threads(tst_conn: sqlite3.Connection):
+    other_conn = sqlite3.connect(":memory:", check_same_thread=False)
+    try:
+        with nm.set_default_db(tst_conn):
+            assert get_count_def_db(2) == 2
+            # Another thread does not see the block
+            assert isinstance(count_def_db_in_thread(), RuntimeError)
+        ctx = Context()
+        ctx.run(nm.set_default_db, other_conn)
+        # The function form sets the default for its own context only...
+        with pytest.raises(sqlite3.OperationalError):
+            ctx.run(get_count_def_db, 2)
+        with pytest.raises(RuntimeError):
+            get_count_def_db(2)
+        # ...and a thread started in it sees it if the context is passed along
+        with ThreadPoolExecutor(1) as executor:
+            exc = executor.submit(ctx.copy().run, get_count_def_db, 2).exception()
+        assert isinstance(exc, sqlite3.OperationalError)
+    finally:
+        other_conn.close()
+
+
+def test_def_db_interleaved(tst_conn: sqlite3.Connection):
+    other_conn = sqlite3.connect(":memory:")
+    try:
+        ctx1, ctx2 = Context(), Context()
+        # Two blocks in different contexts: init1, init2, enter1, enter2
+        cm1 = ctx1.run(nm.set_default_db, tst_conn)
+        cm2 = ctx2.run(nm.set_default_db, other_conn)
+        ctx1.run(cm1.__enter__)
+        ctx2.run(cm2.__enter__)
+        assert ctx1.run(get_count_def_db, 2) == 2
+        with pytest.raises(sqlite3.OperationalError):
+            ctx2.run(get_count_def_db, 2)
+        with pytest.raises(RuntimeError):
+            get_count_def_db(2)
+        assert isinstance(count_def_db_in_thread(), RuntimeError)
+        ctx1.run(cm1.__exit__, None, None, None)
+        ctx2.run(cm2.__exit__, None, None, None)
+        for ctx in (ctx1, ctx2):
+            with pytest.raises(RuntimeError):
+                ctx.run(get_count_def_db, 2)
+    finally:
+        other_conn.close()
+
+
 # Conversions
 
 